@@ -6,10 +6,55 @@ Copyright (c) 2022 Peter Triesberger
 For further information see https://github.com/peter88213/PyWriter
 Published under the MIT License (https://opensource.org/licenses/mit-license.php)
 """
-from urllib.parse import quote
+from functools import lru_cache
 import os
 from pywriter.pywriter_globals import *
 
+_SAFE_BYTES = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/'
+_SAFE_BYTES_BY_ARG = {'/': _SAFE_BYTES, '/:': _SAFE_BYTES + b':'}
+# Bytes left unchanged by quote(), depending on its "safe" argument.
+
+_NEEDS_SEP_FIX = (os.sep == '\\')
+# True if backslashes in paths must be converted to slashes (Windows).
+
+
+def _quote(text, safe='/'):
+    """Return text URL-coded like urllib.parse.quote().
+    
+    Positional arguments:
+        text -- str: text to be URL-coded.
+        
+    Optional arguments:
+        safe -- str: characters not to be encoded ('/' or '/:').
+    
+    Delete all safe bytes first, and call quote() only if something is left.
+    """
+    if text.encode('utf-8').translate(None, _SAFE_BYTES_BY_ARG[safe]):
+        from urllib.parse import quote
+        # Imported on demand; plain paths don't need urllib at all.
+        return quote(text, safe)
+    return text
+
+
+@lru_cache(maxsize=128)
+def _split_project_path(filePath, suffixExtension):
+    """Return a tuple (projectPath, projectName).
+    
+    Positional arguments:
+        filePath -- str: absolute path to the file.
+        suffixExtension -- str: file name ending (suffix and extension) to be removed.
+    
+    The path must be absolute, so the result doesn't depend on the current working directory. 
+    Thus it depends only on the arguments, and is cached for repeated instantiation. 
+    """
+    head, tail = os.path.split(filePath)
+    if _NEEDS_SEP_FIX:
+        head = head.replace('\\', '/')
+    projectPath = _quote(head, '/:')
+    projectName = _quote(tail[:-len(suffixExtension)])
+    # The caller has checked that the file name ends with suffixExtension.
+    return projectPath, projectName
+
 
 class File:
     """Abstract yWriter project file representation.
@@ -26,21 +71,38 @@ class File:
         projectName -- str: URL-coded file name without suffix and extension. 
         projectPath -- str: URL-coded path to the project directory. 
         filePath -- str: path to the file (property with getter and setter). 
+        realFilePath -- str: canonical path to the file, with symbolic links resolved (read-only property). 
     """
+    __slots__ = ('novel', '_filePath', '_realFilePath', 'projectName', 'projectPath')
+    # Subclasses not declaring __slots__ get an instance __dict__ as usual.
+
     DESCRIPTION = _('File')
     EXTENSION = None
     SUFFIX = None
     # To be extended by subclass methods.
 
-    _PRJ_KWVAR = []
-    _CHP_KWVAR = []
-    _SCN_KWVAR = []
-    _CRT_KWVAR = []
-    _LOC_KWVAR = []
-    _ITM_KWVAR = []
-    _PNT_KWVAR = []
+    _PRJ_KWVAR = ()
+    _CHP_KWVAR = ()
+    _SCN_KWVAR = ()
+    _CRT_KWVAR = ()
+    _LOC_KWVAR = ()
+    _ITM_KWVAR = ()
+    _PNT_KWVAR = ()
     # Keyword variables for custom fields in the .yw7 XML file.
 
+    _SUFFIX_EXTENSION = ''
+    _SUFFIX_EXTENSION_LOWER = ''
+    # Required file name ending; set for each subclass by __init_subclass__().
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the required file name ending of the subclass.
+        
+        Extends the superclass method.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._SUFFIX_EXTENSION = f'{cls.SUFFIX or ""}{cls.EXTENSION or ""}'
+        cls._SUFFIX_EXTENSION_LOWER = cls._SUFFIX_EXTENSION.lower()
+
     def __init__(self, filePath, **kwargs):
         """Initialize instance variables.
 
@@ -59,6 +121,10 @@ class File:
         # str
         # Path to the file. The setter only accepts files of a supported type as specified by EXTENSION.
 
+        self._realFilePath = None
+        # str
+        # Canonical path to the file, determined on first access.
+
         self.projectName = None
         # str
         # URL-coded file name without suffix and extension.
@@ -80,15 +146,25 @@ class File:
         - Format the path string according to Python's requirements. 
         - Accept only filenames with the right suffix and extension.
         """
-        if self.SUFFIX is not None:
-            suffix = self.SUFFIX
-        else:
-            suffix = ''
-        if filePath.lower().endswith(f'{suffix}{self.EXTENSION}'.lower()):
+        suffixExtension = self._SUFFIX_EXTENSION
+        length = len(suffixExtension)
+        if length and filePath[-length:].lower() == self._SUFFIX_EXTENSION_LOWER:
+            # Only the file name ending needs to be case-folded for the check.
             self._filePath = filePath
-            head, tail = os.path.split(os.path.realpath(filePath))
-            self.projectPath = quote(head.replace('\\', '/'), '/:')
-            self.projectName = quote(tail.replace(f'{suffix}{self.EXTENSION}', ''))
+            self._realFilePath = None
+            self.projectPath, self.projectName = _split_project_path(os.path.abspath(filePath), suffixExtension)
+            # abspath() doesn't resolve symbolic links, so no file system access is needed.
+            # Making the path absolute before the cached call keeps the working directory in the cache key.
+
+    @property
+    def realFilePath(self):
+        """Return the canonical path to the file, with symbolic links resolved.
+        
+        Resolving the links requires file system access, so it is done only on demand.
+        """
+        if self._realFilePath is None and self._filePath is not None:
+            self._realFilePath = os.path.realpath(self._filePath)
+        return self._realFilePath
 
     def read(self):
         """Parse the file and get the instance variables.
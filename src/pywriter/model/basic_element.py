@@ -14,6 +14,7 @@ class BasicElement:
         desc -- str: description.
         kwVar -- dict: custom keyword variables.
     """
+    __slots__ = ('title', 'desc', 'kwVar')
 
     def __init__(self):
         """Initialize instance variables."""
@@ -7,9 +7,30 @@ For further information see https://github.com/peter88213/PyWriter
 Published under the MIT License (https://opensource.org/licenses/mit-license.php)
 """
 import locale
+import sys
 from pywriter.pywriter_globals import *
 from pywriter.model.basic_element import BasicElement
 
+_SYS_LOCALE = None
+# tuple of str: system language code and country code, determined on first use.
+
+
+def _get_sys_locale():
+    """Return a tuple with the system's language code and country code.
+    
+    The system locale doesn't change at runtime, so it is determined only once.
+    If it can't be determined, return "no language".
+    """
+    global _SYS_LOCALE
+    if _SYS_LOCALE is None:
+        try:
+            sysLng, sysCtr = locale.getlocale()[0].split('_')
+        except (AttributeError, ValueError):
+            # The locale is not set, or has an unexpected format.
+            sysLng, sysCtr = 'zxx', 'none'
+        _SYS_LOCALE = (sysLng, sysCtr)
+    return _SYS_LOCALE
+
 
 class Novel(BasicElement):
     """Novel representation.
@@ -31,16 +52,20 @@ class Novel(BasicElement):
         fieldTitle4 -- str: scene rating field title 4.
         chapters -- dict: (key: ID; value: chapter instance).
         scenes -- dict: (key: ID, value: scene instance).
-        srtChapters -- list: the novel's sorted chapter IDs.
+        srtChapters -- list: the novel's sorted chapter IDs (read-only property, derived from chapters).
         locations -- dict: (key: ID, value: WorldElement instance).
-        srtLocations -- list: the novel's sorted location IDs.
+        srtLocations -- list: the novel's sorted location IDs (read-only property, derived from locations).
         items -- dict: (key: ID, value: WorldElement instance).
-        srtItems -- list: the novel's sorted item IDs.
+        srtItems -- list: the novel's sorted item IDs (read-only property, derived from items).
         characters -- dict: (key: ID, value: character instance).
-        srtCharacters -- list: the novel's sorted character IDs.
+        srtCharacters -- list: the novel's sorted character IDs (read-only property, derived from characters).
         projectNotes -- dict:  (key: ID, value: projectNote instance).
-        srtPrjNotes -- list: the novel's sorted project notes.
+        srtPrjNotes -- list: the novel's sorted project notes (read-only property, derived from projectNotes).
     """
+    __slots__ = ('authorName', 'authorBio', 'fieldTitle1', 'fieldTitle2', 'fieldTitle3', 'fieldTitle4',
+                 'wordTarget', 'wordCountStart', 'languages', 'languageCode', 'countryCode',
+                 '_chapters', '_scenes', '_locations', '_items', '_characters', '_projectNotes')
+    # Instances have no __dict__; the element dictionaries are created on demand.
 
     def __init__(self):
         """Initialize instance variables.
@@ -81,17 +106,14 @@ class Novel(BasicElement):
         # int
         # xml: <PROJECT><wordCountStart>
 
-        self.wordTarget = None
-        # int
-        # xml: <PROJECT><wordCountStart>
-
-        self.chapters = {}
+        self._chapters = None
         # dict
         # xml: <CHAPTERS><CHAPTER><ID>
         # key = chapter ID, value = Chapter instance.
-        # The order of the elements does not matter (the novel's order of the chapters is defined by srtChapters)
+        # The order of the elements is the novel's order of the chapters (see the srtChapters property).
+        # Created on first access (see the chapters property).
 
-        self.scenes = {}
+        self._scenes = None
         # dict
         # xml: <SCENES><SCENE><ID>
         # key = scene ID, value = Scene instance.
@@ -103,50 +125,29 @@ class Novel(BasicElement):
         # List of non-document languages occurring as scene markup.
         # Format: ll-CC, where ll is the language code, and CC is the country code.
 
-        self.srtChapters = []
-        # list of str
-        # The novel's chapter IDs. The order of its elements corresponds to the novel's order of the chapters.
-
-        self.locations = {}
+        self._locations = None
         # dict
         # xml: <LOCATIONS>
         # key = location ID, value = WorldElement instance.
-        # The order of the elements does not matter.
+        # The order of the elements corresponds to the XML project file.
 
-        self.srtLocations = []
-        # list of str
-        # The novel's location IDs. The order of its elements
-        # corresponds to the XML project file.
-
-        self.items = {}
+        self._items = None
         # dict
         # xml: <ITEMS>
         # key = item ID, value = WorldElement instance.
-        # The order of the elements does not matter.
-
-        self.srtItems = []
-        # list of str
-        # The novel's item IDs. The order of its elements corresponds to the XML project file.
+        # The order of the elements corresponds to the XML project file.
 
-        self.characters = {}
+        self._characters = None
         # dict
         # xml: <CHARACTERS>
         # key = character ID, value = Character instance.
-        # The order of the elements does not matter.
-
-        self.srtCharacters = []
-        # list of str
-        # The novel's character IDs. The order of its elements corresponds to the XML project file.
+        # The order of the elements corresponds to the XML project file.
 
-        self.projectNotes = {}
+        self._projectNotes = None
         # dict
         # xml: <PROJECTNOTES>
         # key = note ID, value = note instance.
-        # The order of the elements does not matter.
-
-        self.srtPrjNotes = []
-        # list of str
-        # The novel's projectNote IDs. The order of its elements corresponds to the XML project file.
+        # The order of the elements corresponds to the XML project file.
 
         self.languageCode = None
         # str
@@ -156,6 +157,91 @@ class Novel(BasicElement):
         # str
         # Country code acc. to ISO 3166-2.
 
+    @property
+    def chapters(self):
+        if self._chapters is None:
+            self._chapters = {}
+        return self._chapters
+
+    @chapters.setter
+    def chapters(self, elements):
+        self._chapters = elements
+
+    @property
+    def scenes(self):
+        if self._scenes is None:
+            self._scenes = {}
+        return self._scenes
+
+    @scenes.setter
+    def scenes(self, elements):
+        self._scenes = elements
+
+    @property
+    def locations(self):
+        if self._locations is None:
+            self._locations = {}
+        return self._locations
+
+    @locations.setter
+    def locations(self, elements):
+        self._locations = elements
+
+    @property
+    def items(self):
+        if self._items is None:
+            self._items = {}
+        return self._items
+
+    @items.setter
+    def items(self, elements):
+        self._items = elements
+
+    @property
+    def characters(self):
+        if self._characters is None:
+            self._characters = {}
+        return self._characters
+
+    @characters.setter
+    def characters(self, elements):
+        self._characters = elements
+
+    @property
+    def projectNotes(self):
+        if self._projectNotes is None:
+            self._projectNotes = {}
+        return self._projectNotes
+
+    @projectNotes.setter
+    def projectNotes(self, elements):
+        self._projectNotes = elements
+
+    @property
+    def srtChapters(self):
+        """Return a list of the chapter IDs, in the order of the chapters dictionary."""
+        return list(self.chapters)
+
+    @property
+    def srtLocations(self):
+        """Return a list of the location IDs, in the order of the locations dictionary."""
+        return list(self.locations)
+
+    @property
+    def srtItems(self):
+        """Return a list of the item IDs, in the order of the items dictionary."""
+        return list(self.items)
+
+    @property
+    def srtCharacters(self):
+        """Return a list of the character IDs, in the order of the characters dictionary."""
+        return list(self.characters)
+
+    @property
+    def srtPrjNotes(self):
+        """Return a list of the project note IDs, in the order of the projectNotes dictionary."""
+        return list(self.projectNotes)
+
     def get_languages(self):
         """Determine the languages used in the document.
         
@@ -163,14 +249,14 @@ class Novel(BasicElement):
         Example:
         - language markup: 'Standard text [lang=en-AU]Australian text[/lang=en-AU].'
         - language code: 'en-AU'
+        
+        The scenes collect their language codes when their content is set,
+        so the scene contents need not be scanned again here.
         """
-        self.languages = []
-        for scId in self.scenes:
-            text = self.scenes[scId].sceneContent
-            if text:
-                for language in get_languages(text):
-                    if not language in self.languages:
-                        self.languages.append(language)
+        codes = dict.fromkeys(code for scene in self.scenes.values() for code in scene.languages)
+        # dict.fromkeys() removes duplicates, keeping the order of first occurrence.
+        self.languages = [sys.intern(code) for code in codes]
+        # Interning the distinct codes lets later comparisons short-cut on identity.
 
     def check_locale(self):
         """Check the document's locale (language code and country code).
@@ -180,20 +266,14 @@ class Novel(BasicElement):
         """
         if not self.languageCode or not self.countryCode:
             # Language or country isn't set.
-            sysLng, sysCtr = locale.getlocale()[0].split('_')
-            self.languageCode = sysLng
-            self.countryCode = sysCtr
+            self.languageCode, self.countryCode = _get_sys_locale()
             return
 
-        try:
-            # Plausibility check: code must have two characters.
-            if len(self.languageCode) == 2:
-                if len(self.countryCode) == 2:
-                    return
-                    # keep the setting
-        except:
-            # code isn't a string
-            pass
+        # Plausibility check: code must be a string with two characters.
+        if isinstance(self.languageCode, str) and len(self.languageCode) == 2:
+            if isinstance(self.countryCode, str) and len(self.countryCode) == 2:
+                return
+                # keep the setting
         # Existing language or country field looks not plausible
         self.languageCode = 'zxx'
         self.countryCode = 'none'
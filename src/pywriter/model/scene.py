@@ -14,8 +14,9 @@ class Scene(BasicElement):
     
     Public instance variables:
         sceneContent -- str: scene content (property with getter and setter).
-        wordCount - int: word count (derived; updated by the sceneContent setter).
-        letterCount - int: letter count (derived; updated by the sceneContent setter).
+        wordCount - int: word count (derived from sceneContent on first access; property with getter and setter).
+        letterCount - int: letter count (derived from sceneContent on first access; property with getter and setter).
+        languages - list of str: language codes used in the scene content (derived; updated by the sceneContent setter).
         scType -- int: Scene type (Normal/Notes/Todo/Unused).
         doNotExport -- bool: True if the scene is not to be exported to RTF.
         status -- int: scene status (Outline/Draft/1st Edit/2nd Edit/Done).
@@ -66,13 +67,18 @@ class Scene(BasicElement):
         # xml: <SceneContent>
         # Scene text with yW7 raw markup.
 
-        self.wordCount = 0
+        self._wordCount = 0
         # int # xml: <WordCount>
-        # To be updated by the sceneContent setter
+        # Reset by the sceneContent setter; None means "to be counted".
 
-        self.letterCount = 0
+        self._letterCount = 0
         # int
         # xml: <LetterCount>
+        # Reset by the sceneContent setter; None means "to be counted".
+
+        self.languages = []
+        # list of str
+        # Language codes occurring as markup in the scene content, in order of first occurrence.
         # To be updated by the sceneContent setter
 
         self.scType = None
@@ -233,11 +239,36 @@ class Scene(BasicElement):
 
     @sceneContent.setter
     def sceneContent(self, text):
-        """Set sceneContent updating word count and letter count."""
+        """Set sceneContent updating languages.
+        
+        Word count and letter count are determined when they are needed, 
+        so scenes whose counts are never queried are not counted at all.
+        """
         self._sceneContent = text
-        text = ADDITIONAL_WORD_LIMITS.sub(' ', text)
-        text = NO_WORD_LIMITS.sub('', text)
-        wordList = text.split()
-        self.wordCount = len(wordList)
-        text = NON_LETTERS.sub('', self._sceneContent)
-        self.letterCount = len(text)
+        self.languages = list(dict.fromkeys(get_languages(text)))
+        self._wordCount = None
+        self._letterCount = None
+
+    @property
+    def wordCount(self):
+        if self._wordCount is None:
+            text = ADDITIONAL_WORD_LIMITS.sub(' ', self._sceneContent)
+            text = NO_WORD_LIMITS.sub('', text)
+            wordList = text.split()
+            self._wordCount = len(wordList)
+        return self._wordCount
+
+    @wordCount.setter
+    def wordCount(self, count):
+        self._wordCount = count
+
+    @property
+    def letterCount(self):
+        if self._letterCount is None:
+            text = NON_LETTERS.sub('', self._sceneContent)
+            self._letterCount = len(text)
+        return self._letterCount
+
+    @letterCount.setter
+    def letterCount(self, count):
+        self._letterCount = count
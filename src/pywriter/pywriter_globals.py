@@ -110,20 +110,18 @@ def list_to_string(elements, divider=';'):
         return ''
 
 
-LANGUAGE_TAG = re.compile('\[lang=(.*?)\]')
+LANGUAGE_TAG = re.compile('\[lang=([^\]\n]*)\]')
+# Same matches as a non-greedy '(.*?)', but no backtracking is needed.
 
 
 def get_languages(text):
-    """Return a generator object with the language codes appearing in text.
+    """Return a list with the language codes appearing in text.
     
     Example:
     - language markup: 'Standard text [lang=en-AU]Australian text[/lang=en-AU].'
     - language code: 'en-AU'
     """
     if text:
-        m = LANGUAGE_TAG.search(text)
-        while m:
-            text = text[m.span()[1]:]
-            yield m.group(1)
-            m = LANGUAGE_TAG.search(text)
+        return LANGUAGE_TAG.findall(text)
+    return []
 
@@ -11,17 +11,29 @@ def indent(elem, level=0):
 
     Kudos to to Fredrik Lundh. 
     Source: http://effbot.org/zone/element-lib.htm#prettyprint
+    
+    The tree is walked iteratively. The tails of the subelements are set 
+    together with their parent's text, so leaf elements are not visited separately.
     """
     i = f'\n{level * "  "}'
-    if elem:
-        if not elem.text or not elem.text.strip():
-            elem.text = f'{i}  '
+    if len(elem) or level:
         if not elem.tail or not elem.tail.strip():
             elem.tail = i
-        for elem in elem:
-            indent(elem, level + 1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
+    parents = [(elem, i)]
+    # Elements with subelements, and their indentation.
+    while parents:
+        parent, i = parents.pop()
+        if not len(parent):
+            continue
+
+        childIndent = f'{i}  '
+        if not parent.text or not parent.text.strip():
+            parent.text = childIndent
+        for child in parent:
+            if not child.tail or not child.tail.strip():
+                child.tail = childIndent
+            if len(child):
+                parents.append((child, childIndent))
+        if not child.tail.strip():
+            # The last subelement's tail closes the parent.
+            child.tail = i
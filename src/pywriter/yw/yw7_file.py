@@ -9,6 +9,7 @@ Published under the MIT License (https://opensource.org/licenses/mit-license.php
 import os
 import re
 from html import unescape
+from io import BytesIO, TextIOWrapper
 import xml.etree.ElementTree as ET
 from pywriter.pywriter_globals import *
 from pywriter.model.chapter import Chapter
@@ -21,6 +22,18 @@ from pywriter.model.id_generator import create_id
 from pywriter.yw.xml_indent import indent
 
 
+def _get_children(parent):
+    """Return a dictionary with the parent's child elements; key: tag, value: element.
+    
+    Positional arguments:
+        parent -- xml element.
+    
+    Looking up the dictionary is faster than searching the children with find().
+    Like find(), take the first element if a tag occurs more than once.
+    """
+    return {child.tag: child for child in reversed(parent)}
+
+
 class Yw7File(File):
     """yWriter 7 project file representation.
 
@@ -33,7 +46,10 @@ class Yw7File(File):
     Public instance variables:
         tree -- xml element tree of the yWriter project
         scenesSplit -- bool: True, if a scene or chapter is split during merging.
+        fsync -- bool: if True, force the written file to disk before write() returns.
     """
+    __slots__ = ('tree', 'scenesSplit', 'fsync', '_lockPath')
+
     DESCRIPTION = _('yWriter 7 project')
     EXTENSION = '.yw7'
     _CDATA_TAGS = ['Title', 'AuthorName', 'Bio', 'Desc',
@@ -44,15 +60,66 @@ class Yw7File(File):
                    'Outcome', 'Goal', 'Conflict']
     # Names of xml elements containing CDATA.
     # ElementTree.write omits CDATA tags, so they have to be inserted afterwards.
+    _CDATA_OPENING_TAG = re.compile(f'<({"|".join(_CDATA_TAGS)})>')
+    _CDATA_CLOSING_TAG = re.compile(f'</({"|".join(_CDATA_TAGS)})>')
+    # Alternations of the tags above; compiled again by __init_subclass__() if a subclass has its own list.
 
-    _PRJ_KWVAR = [
+    _PRJ_KWVAR = (
         'Field_LanguageCode',
         'Field_CountryCode',
-        ]
-    _SCN_KWVAR = [
+        )
+    _SCN_KWVAR = (
         'Field_SceneArcs',
         'Field_SceneStyle',
-        ]
+        )
+    # Immutable; the order of the entries determines the order of the custom fields.
+
+    _SCN_RATING_FIELDS = (
+        ('Field1', 'field1'),
+        ('Field2', 'field2'),
+        ('Field3', 'field3'),
+        ('Field4', 'field4'),
+        )
+    _SCN_UNSPECIFIC_TIME_FIELDS = (
+        ('Day', 'day'),
+        ('Hour', 'hour'),
+        ('Minute', 'minute'),
+        )
+    _SCN_DURATION_FIELDS = (
+        ('LastsDays', 'lastsDays'),
+        ('LastsHours', 'lastsHours'),
+        ('LastsMinutes', 'lastsMinutes'),
+        )
+    _SCN_PLOT_FIELDS = (
+        ('Goal', 'goal'),
+        ('Conflict', 'conflict'),
+        ('Outcome', 'outcome'),
+        ('ImageFile', 'image'),
+        )
+    # (xml tag, Scene attribute) pairs of plain text scene elements, in the order of writing.
+
+    _PRJ_TEXT_FIELDS = (
+        ('Title', 'title'),
+        ('Desc', 'desc'),
+        ('AuthorName', 'authorName'),
+        ('Bio', 'authorBio'),
+        ('FieldTitle1', 'fieldTitle1'),
+        ('FieldTitle2', 'fieldTitle2'),
+        ('FieldTitle3', 'fieldTitle3'),
+        ('FieldTitle4', 'fieldTitle4'),
+        )
+    # (xml tag, Novel attribute) pairs of plain text project elements, in the order of writing.
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the CDATA tag patterns of a subclass that defines its own CDATA tags.
+        
+        Extends the superclass method.
+        """
+        super().__init_subclass__(**kwargs)
+        if '_CDATA_TAGS' in cls.__dict__:
+            cdataTags = '|'.join(cls._CDATA_TAGS)
+            cls._CDATA_OPENING_TAG = re.compile(f'<({cdataTags})>')
+            cls._CDATA_CLOSING_TAG = re.compile(f'</({cdataTags})>')
 
     def __init__(self, filePath, **kwargs):
         """Initialize instance variables.
@@ -69,7 +136,19 @@ class Yw7File(File):
         self.tree = None
         self.scenesSplit = False
 
-        #--- Initialize custom keyword variables.
+        self.fsync = False
+        # bool
+        # Off by default: Flushing the operating system's buffers makes saving much slower on some disks.
+
+    @File.filePath.setter
+    def filePath(self, filePath):
+        """Setter for the filePath instance variable.
+        
+        Extends the superclass setter by keeping the path of yWriter's lock file.
+        """
+        File.filePath.fset(self, filePath)
+        self._lockPath = f'{self._filePath}.lock'
+
     def read(self):
         """Parse the yWriter xml file and get the instance variables.
         
@@ -77,216 +156,235 @@ class Yw7File(File):
         Overrides the superclass method.
         """
 
+        def to_int(text, default=0):
+            """Return text converted to an integer, or default if text isn't a decimal number.
+            
+            A leading sign is accepted; digit group underscores are not.
+            """
+            if text:
+                number = text.strip()
+                if number[:1] in ('+', '-'):
+                    digits = number[1:]
+                else:
+                    digits = number
+                if digits.isdecimal():
+                    return int(number)
+            return default
+
         def read_project(root):
             #--- Read attributes at project level from the xml element tree.
+            kwVarNames = frozenset(self._PRJ_KWVAR)
+            # Custom field names, for fast membership tests.
             prj = root.find('PROJECT')
+            children = _get_children(prj)
 
-            if prj.find('Title') is not None:
-                self.novel.title = prj.find('Title').text
+            if 'Title' in children:
+                self.novel.title = children['Title'].text
 
-            if prj.find('AuthorName') is not None:
-                self.novel.authorName = prj.find('AuthorName').text
+            if 'AuthorName' in children:
+                self.novel.authorName = children['AuthorName'].text
 
-            if prj.find('Bio') is not None:
-                self.novel.authorBio = prj.find('Bio').text
+            if 'Bio' in children:
+                self.novel.authorBio = children['Bio'].text
 
-            if prj.find('Desc') is not None:
-                self.novel.desc = prj.find('Desc').text
+            if 'Desc' in children:
+                self.novel.desc = children['Desc'].text
 
-            if prj.find('FieldTitle1') is not None:
-                self.novel.fieldTitle1 = prj.find('FieldTitle1').text
+            if 'FieldTitle1' in children:
+                self.novel.fieldTitle1 = children['FieldTitle1'].text
 
-            if prj.find('FieldTitle2') is not None:
-                self.novel.fieldTitle2 = prj.find('FieldTitle2').text
+            if 'FieldTitle2' in children:
+                self.novel.fieldTitle2 = children['FieldTitle2'].text
 
-            if prj.find('FieldTitle3') is not None:
-                self.novel.fieldTitle3 = prj.find('FieldTitle3').text
+            if 'FieldTitle3' in children:
+                self.novel.fieldTitle3 = children['FieldTitle3'].text
 
-            if prj.find('FieldTitle4') is not None:
-                self.novel.fieldTitle4 = prj.find('FieldTitle4').text
+            if 'FieldTitle4' in children:
+                self.novel.fieldTitle4 = children['FieldTitle4'].text
 
             #--- Read word target data.
-            if prj.find('WordCountStart') is not None:
-                try:
-                    self.novel.wordCountStart = int(prj.find('WordCountStart').text)
-                except:
-                    self.novel.wordCountStart = 0
-            if prj.find('WordTarget') is not None:
-                try:
-                    self.novel.wordTarget = int(prj.find('WordTarget').text)
-                except:
-                    self.novel.wordTarget = 0
+            if 'WordCountStart' in children:
+                self.novel.wordCountStart = to_int(children['WordCountStart'].text)
+            if 'WordTarget' in children:
+                self.novel.wordTarget = to_int(children['WordTarget'].text)
 
             #--- Initialize custom keyword variables.
-            for fieldName in self._PRJ_KWVAR:
-                self.novel.kwVar[fieldName] = None
+            kwVar = dict.fromkeys(self._PRJ_KWVAR)
+            self.novel.kwVar = kwVar
 
             #--- Read project custom fields.
             for prjFields in prj.findall('Fields'):
-                for fieldName in self._PRJ_KWVAR:
-                    field = prjFields.find(fieldName)
-                    if field is not None:
-                        self.novel.kwVar[fieldName] = field.text
+                for field in prjFields:
+                    if field.tag in kwVarNames:
+                        kwVar[field.tag] = field.text
 
             # This is for projects written with v7.6 - v7.10:
-            if self.novel.kwVar['Field_LanguageCode']:
-                self.novel.languageCode = self.novel.kwVar['Field_LanguageCode']
-            if self.novel.kwVar['Field_CountryCode']:
-                self.novel.countryCode = self.novel.kwVar['Field_CountryCode']
+            if kwVar['Field_LanguageCode']:
+                self.novel.languageCode = kwVar['Field_LanguageCode']
+            if kwVar['Field_CountryCode']:
+                self.novel.countryCode = kwVar['Field_CountryCode']
 
         def read_locations(root):
             #--- Read locations from the xml element tree.
-            self.novel.srtLocations = []
+            kwVarNames = frozenset(self._LOC_KWVAR)
+            stripSpaces = self._strip_spaces
+            stringToList = string_to_list
+            # Bound once, not looked up again for every record.
+            self.novel.locations = {}
             # This is necessary for re-reading.
-            for loc in root.iter('LOCATION'):
-                lcId = loc.find('ID').text
-                self.novel.srtLocations.append(lcId)
-                self.novel.locations[lcId] = WorldElement()
+            for loc in root.iterfind('LOCATIONS/LOCATION'):
+                children = _get_children(loc)
+                lcId = children['ID'].text
+                location = WorldElement()
+                self.novel.locations[lcId] = location
 
-                if loc.find('Title') is not None:
-                    self.novel.locations[lcId].title = loc.find('Title').text
+                if 'Title' in children:
+                    location.title = children['Title'].text
 
-                if loc.find('ImageFile') is not None:
-                    self.novel.locations[lcId].image = loc.find('ImageFile').text
+                if 'ImageFile' in children:
+                    location.image = children['ImageFile'].text
 
-                if loc.find('Desc') is not None:
-                    self.novel.locations[lcId].desc = loc.find('Desc').text
+                if 'Desc' in children:
+                    location.desc = children['Desc'].text
 
-                if loc.find('AKA') is not None:
-                    self.novel.locations[lcId].aka = loc.find('AKA').text
+                if 'AKA' in children:
+                    location.aka = children['AKA'].text
 
-                if loc.find('Tags') is not None:
-                    if loc.find('Tags').text is not None:
-                        tags = string_to_list(loc.find('Tags').text)
-                        self.novel.locations[lcId].tags = self._strip_spaces(tags)
+                if 'Tags' in children:
+                    if children['Tags'].text is not None:
+                        location.tags = stripSpaces(stringToList(children['Tags'].text))
 
                 #--- Initialize custom keyword variables.
-                for fieldName in self._LOC_KWVAR:
-                    self.novel.locations[lcId].kwVar[fieldName] = None
+                kwVar = dict.fromkeys(self._LOC_KWVAR)
+                location.kwVar = kwVar
 
                 #--- Read location custom fields.
                 for lcFields in loc.findall('Fields'):
-                    for fieldName in self._LOC_KWVAR:
-                        field = lcFields.find(fieldName)
-                        if field is not None:
-                            self.novel.locations[lcId].kwVar[fieldName] = field.text
+                    for field in lcFields:
+                        if field.tag in kwVarNames:
+                            kwVar[field.tag] = field.text
 
         def read_items(root):
             #--- Read items from the xml element tree.
-            self.novel.srtItems = []
+            kwVarNames = frozenset(self._ITM_KWVAR)
+            stripSpaces = self._strip_spaces
+            stringToList = string_to_list
+            # Bound once, not looked up again for every record.
+            self.novel.items = {}
             # This is necessary for re-reading.
-            for itm in root.iter('ITEM'):
-                itId = itm.find('ID').text
-                self.novel.srtItems.append(itId)
-                self.novel.items[itId] = WorldElement()
+            for itm in root.iterfind('ITEMS/ITEM'):
+                children = _get_children(itm)
+                itId = children['ID'].text
+                item = WorldElement()
+                self.novel.items[itId] = item
 
-                if itm.find('Title') is not None:
-                    self.novel.items[itId].title = itm.find('Title').text
+                if 'Title' in children:
+                    item.title = children['Title'].text
 
-                if itm.find('ImageFile') is not None:
-                    self.novel.items[itId].image = itm.find('ImageFile').text
+                if 'ImageFile' in children:
+                    item.image = children['ImageFile'].text
 
-                if itm.find('Desc') is not None:
-                    self.novel.items[itId].desc = itm.find('Desc').text
+                if 'Desc' in children:
+                    item.desc = children['Desc'].text
 
-                if itm.find('AKA') is not None:
-                    self.novel.items[itId].aka = itm.find('AKA').text
+                if 'AKA' in children:
+                    item.aka = children['AKA'].text
 
-                if itm.find('Tags') is not None:
-                    if itm.find('Tags').text is not None:
-                        tags = string_to_list(itm.find('Tags').text)
-                        self.novel.items[itId].tags = self._strip_spaces(tags)
+                if 'Tags' in children:
+                    if children['Tags'].text is not None:
+                        item.tags = stripSpaces(stringToList(children['Tags'].text))
 
                 #--- Initialize custom keyword variables.
-                for fieldName in self._ITM_KWVAR:
-                    self.novel.items[itId].kwVar[fieldName] = None
+                kwVar = dict.fromkeys(self._ITM_KWVAR)
+                item.kwVar = kwVar
 
                 #--- Read item custom fields.
                 for itFields in itm.findall('Fields'):
-                    for fieldName in self._ITM_KWVAR:
-                        field = itFields.find(fieldName)
-                        if field is not None:
-                            self.novel.items[itId].kwVar[fieldName] = field.text
+                    for field in itFields:
+                        if field.tag in kwVarNames:
+                            kwVar[field.tag] = field.text
 
         def read_characters(root):
             #--- Read characters from the xml element tree.
-            self.novel.srtCharacters = []
+            kwVarNames = frozenset(self._CRT_KWVAR)
+            stripSpaces = self._strip_spaces
+            stringToList = string_to_list
+            # Bound once, not looked up again for every record.
+            self.novel.characters = {}
             # This is necessary for re-reading.
-            for crt in root.iter('CHARACTER'):
-                crId = crt.find('ID').text
-                self.novel.srtCharacters.append(crId)
-                self.novel.characters[crId] = Character()
+            for crt in root.iterfind('CHARACTERS/CHARACTER'):
+                children = _get_children(crt)
+                crId = children['ID'].text
+                character = Character()
+                self.novel.characters[crId] = character
 
-                if crt.find('Title') is not None:
-                    self.novel.characters[crId].title = crt.find('Title').text
+                if 'Title' in children:
+                    character.title = children['Title'].text
 
-                if crt.find('ImageFile') is not None:
-                    self.novel.characters[crId].image = crt.find('ImageFile').text
+                if 'ImageFile' in children:
+                    character.image = children['ImageFile'].text
 
-                if crt.find('Desc') is not None:
-                    self.novel.characters[crId].desc = crt.find('Desc').text
+                if 'Desc' in children:
+                    character.desc = children['Desc'].text
 
-                if crt.find('AKA') is not None:
-                    self.novel.characters[crId].aka = crt.find('AKA').text
+                if 'AKA' in children:
+                    character.aka = children['AKA'].text
 
-                if crt.find('Tags') is not None:
-                    if crt.find('Tags').text is not None:
-                        tags = string_to_list(crt.find('Tags').text)
-                        self.novel.characters[crId].tags = self._strip_spaces(tags)
+                if 'Tags' in children:
+                    if children['Tags'].text is not None:
+                        character.tags = stripSpaces(stringToList(children['Tags'].text))
 
-                if crt.find('Notes') is not None:
-                    self.novel.characters[crId].notes = crt.find('Notes').text
+                if 'Notes' in children:
+                    character.notes = children['Notes'].text
 
-                if crt.find('Bio') is not None:
-                    self.novel.characters[crId].bio = crt.find('Bio').text
+                if 'Bio' in children:
+                    character.bio = children['Bio'].text
 
-                if crt.find('Goals') is not None:
-                    self.novel.characters[crId].goals = crt.find('Goals').text
+                if 'Goals' in children:
+                    character.goals = children['Goals'].text
 
-                if crt.find('FullName') is not None:
-                    self.novel.characters[crId].fullName = crt.find('FullName').text
+                if 'FullName' in children:
+                    character.fullName = children['FullName'].text
 
-                if crt.find('Major') is not None:
-                    self.novel.characters[crId].isMajor = True
-                else:
-                    self.novel.characters[crId].isMajor = False
+                character.isMajor = 'Major' in children
 
                 #--- Initialize custom keyword variables.
-                for fieldName in self._CRT_KWVAR:
-                    self.novel.characters[crId].kwVar[fieldName] = None
+                kwVar = dict.fromkeys(self._CRT_KWVAR)
+                character.kwVar = kwVar
 
                 #--- Read character custom fields.
                 for crFields in crt.findall('Fields'):
-                    for fieldName in self._CRT_KWVAR:
-                        field = crFields.find(fieldName)
-                        if field is not None:
-                            self.novel.characters[crId].kwVar[fieldName] = field.text
+                    for field in crFields:
+                        if field.tag in kwVarNames:
+                            kwVar[field.tag] = field.text
 
         def read_projectnotes(root):
             #--- Read project notes from the xml element tree.
-            self.novel.srtPrjNotes = []
+            kwVarNames = frozenset(self._PNT_KWVAR)
+            self.novel.projectNotes = {}
             # This is necessary for re-reading.
 
             try:
                 for pnt in root.find('PROJECTNOTES'):
-                    if pnt.find('ID') is not None:
-                        pnId = pnt.find('ID').text
-                        self.novel.srtPrjNotes.append(pnId)
-                        self.novel.projectNotes[pnId] = BasicElement()
-                        if pnt.find('Title') is not None:
-                            self.novel.projectNotes[pnId].title = pnt.find('Title').text
-                        if pnt.find('Desc') is not None:
-                            self.novel.projectNotes[pnId].desc = pnt.find('Desc').text
+                    children = _get_children(pnt)
+                    if 'ID' in children:
+                        pnId = children['ID'].text
+                        prjNote = BasicElement()
+                        self.novel.projectNotes[pnId] = prjNote
+                        if 'Title' in children:
+                            prjNote.title = children['Title'].text
+                        if 'Desc' in children:
+                            prjNote.desc = children['Desc'].text
 
                     #--- Initialize project note custom fields.
-                    for fieldName in self._PNT_KWVAR:
-                        self.novel.projectNotes[pnId].kwVar[fieldName] = None
+                    kwVar = dict.fromkeys(self._PNT_KWVAR)
+                    prjNote.kwVar = kwVar
 
                     #--- Read project note custom fields.
                     for pnFields in pnt.findall('Fields'):
-                        field = pnFields.find(fieldName)
-                        if field is not None:
-                            self.novel.projectNotes[pnId].kwVar[fieldName] = field.text
+                        for field in pnFields:
+                            if field.tag in kwVarNames:
+                                kwVar[field.tag] = field.text
             except:
                 pass
 
@@ -294,43 +392,53 @@ class Yw7File(File):
             #--- Read relevant project variables from the xml element tree.
             try:
                 for projectvar in root.find('PROJECTVARS'):
-                    if projectvar.find('Title') is not None:
-                        title = projectvar.find('Title').text
+                    children = _get_children(projectvar)
+                    if 'Title' in children:
+                        title = children['Title'].text
                         if title == 'Language':
-                            if projectvar.find('Desc') is not None:
-                                self.novel.languageCode = projectvar.find('Desc').text
+                            if 'Desc' in children:
+                                self.novel.languageCode = children['Desc'].text
 
                         elif title == 'Country':
-                            if projectvar.find('Desc') is not None:
-                                self.novel.countryCode = projectvar.find('Desc').text
+                            if 'Desc' in children:
+                                self.novel.countryCode = children['Desc'].text
 
                         elif title.startswith('lang='):
-                            try:
-                                __, langCode = title.split('=')
+                            __, __, langCode = title.partition('=')
+                            if not '=' in langCode:
+                                # Titles with more than one "=" are not language code tags.
                                 if self.novel.languages is None:
                                     self.novel.languages = []
                                 self.novel.languages.append(langCode)
-                            except:
-                                pass
             except:
                 pass
 
         def read_scenes(root):
             #--- Read attributes at scene level from the xml element tree.
-            for scn in root.iter('SCENE'):
-                scId = scn.find('ID').text
-                self.novel.scenes[scId] = Scene()
-
-                if scn.find('Title') is not None:
-                    self.novel.scenes[scId].title = scn.find('Title').text
-
-                if scn.find('Desc') is not None:
-                    self.novel.scenes[scId].desc = scn.find('Desc').text
-
-                if scn.find('SceneContent') is not None:
-                    sceneContent = scn.find('SceneContent').text
+            kwVarNames = frozenset(self._SCN_KWVAR)
+            characters = self.novel.characters
+            locations = self.novel.locations
+            items = self.novel.items
+            # Scenes refer only to elements that have been read before.
+            stripSpaces = self._strip_spaces
+            stringToList = string_to_list
+            # Bound once, not looked up again for every record.
+            for scn in root.iterfind('SCENES/SCENE'):
+                children = _get_children(scn)
+                scId = children['ID'].text
+                scene = Scene()
+                self.novel.scenes[scId] = scene
+
+                if 'Title' in children:
+                    scene.title = children['Title'].text
+
+                if 'Desc' in children:
+                    scene.desc = children['Desc'].text
+
+                if 'SceneContent' in children:
+                    sceneContent = children['SceneContent'].text
                     if sceneContent is not None:
-                        self.novel.scenes[scId].sceneContent = sceneContent
+                        scene.sceneContent = sceneContent
 
                 #--- Read scene type.
 
@@ -345,156 +453,136 @@ class Yw7File(File):
                 # Normal | N/A    | N/A            | 0
                 # Normal | N/A    | 0              | 0
 
-                self.novel.scenes[scId].scType = 0
+                scene.scType = 0
 
                 #--- Initialize custom keyword variables.
-                for fieldName in self._SCN_KWVAR:
-                    self.novel.scenes[scId].kwVar[fieldName] = None
+                kwVar = dict.fromkeys(self._SCN_KWVAR)
+                scene.kwVar = kwVar
 
                 for scFields in scn.findall('Fields'):
                     #--- Read scene custom fields.
-                    for fieldName in self._SCN_KWVAR:
-                        field = scFields.find(fieldName)
-                        if field is not None:
-                            self.novel.scenes[scId].kwVar[fieldName] = field.text
+                    for field in scFields:
+                        if field.tag in kwVarNames:
+                            kwVar[field.tag] = field.text
 
                     # Read scene type, if any.
-                    if scFields.find('Field_SceneType') is not None:
-                        if scFields.find('Field_SceneType').text == '1':
-                            self.novel.scenes[scId].scType = 1
-                        elif scFields.find('Field_SceneType').text == '2':
-                            self.novel.scenes[scId].scType = 2
-                if scn.find('Unused') is not None:
-                    if self.novel.scenes[scId].scType == 0:
-                        self.novel.scenes[scId].scType = 3
+                    scTypeField = scFields.findtext('Field_SceneType')
+                    # None if the field is missing.
+                    if scTypeField == '1':
+                        scene.scType = 1
+                    elif scTypeField == '2':
+                        scene.scType = 2
+                if 'Unused' in children:
+                    if scene.scType == 0:
+                        scene.scType = 3
 
                 #--- Export when RTF.
-                if scn.find('ExportCondSpecific') is None:
-                    self.novel.scenes[scId].doNotExport = False
-                elif scn.find('ExportWhenRTF') is not None:
-                    self.novel.scenes[scId].doNotExport = False
-                else:
-                    self.novel.scenes[scId].doNotExport = True
+                scene.doNotExport = ('ExportCondSpecific' in children and
+                                     'ExportWhenRTF' not in children)
 
-                if scn.find('Status') is not None:
-                    self.novel.scenes[scId].status = int(scn.find('Status').text)
+                if 'Status' in children:
+                    scene.status = to_int(children['Status'].text, None)
 
-                if scn.find('Notes') is not None:
-                    self.novel.scenes[scId].notes = scn.find('Notes').text
+                if 'Notes' in children:
+                    scene.notes = children['Notes'].text
 
-                if scn.find('Tags') is not None:
-                    if scn.find('Tags').text is not None:
-                        tags = string_to_list(scn.find('Tags').text)
-                        self.novel.scenes[scId].tags = self._strip_spaces(tags)
+                if 'Tags' in children:
+                    if children['Tags'].text is not None:
+                        scene.tags = stripSpaces(stringToList(children['Tags'].text))
 
-                if scn.find('Field1') is not None:
-                    self.novel.scenes[scId].field1 = scn.find('Field1').text
+                if 'Field1' in children:
+                    scene.field1 = children['Field1'].text
 
-                if scn.find('Field2') is not None:
-                    self.novel.scenes[scId].field2 = scn.find('Field2').text
+                if 'Field2' in children:
+                    scene.field2 = children['Field2'].text
 
-                if scn.find('Field3') is not None:
-                    self.novel.scenes[scId].field3 = scn.find('Field3').text
+                if 'Field3' in children:
+                    scene.field3 = children['Field3'].text
 
-                if scn.find('Field4') is not None:
-                    self.novel.scenes[scId].field4 = scn.find('Field4').text
+                if 'Field4' in children:
+                    scene.field4 = children['Field4'].text
 
-                if scn.find('AppendToPrev') is not None:
-                    self.novel.scenes[scId].appendToPrev = True
-                else:
-                    self.novel.scenes[scId].appendToPrev = False
-
-                if scn.find('SpecificDateTime') is not None:
-                    dateTime = scn.find('SpecificDateTime').text.split(' ')
-                    for dt in dateTime:
-                        if '-' in dt:
-                            self.novel.scenes[scId].date = dt
-                        elif ':' in dt:
-                            self.novel.scenes[scId].time = dt
+                scene.appendToPrev = 'AppendToPrev' in children
+
+                if 'SpecificDateTime' in children:
+                    date, __, time = children['SpecificDateTime'].text.partition(' ')
+                    # Format: 'yyyy-mm-dd hh:mm:ss'
+                    if '-' in date:
+                        scene.date = date
+                    if ':' in time:
+                        scene.time = time
                 else:
-                    if scn.find('Day') is not None:
-                        self.novel.scenes[scId].day = scn.find('Day').text
+                    if 'Day' in children:
+                        scene.day = children['Day'].text
 
-                    if scn.find('Hour') is not None:
-                        self.novel.scenes[scId].hour = scn.find('Hour').text
+                    if 'Hour' in children:
+                        scene.hour = children['Hour'].text
 
-                    if scn.find('Minute') is not None:
-                        self.novel.scenes[scId].minute = scn.find('Minute').text
+                    if 'Minute' in children:
+                        scene.minute = children['Minute'].text
 
-                if scn.find('LastsDays') is not None:
-                    self.novel.scenes[scId].lastsDays = scn.find('LastsDays').text
+                if 'LastsDays' in children:
+                    scene.lastsDays = children['LastsDays'].text
 
-                if scn.find('LastsHours') is not None:
-                    self.novel.scenes[scId].lastsHours = scn.find('LastsHours').text
+                if 'LastsHours' in children:
+                    scene.lastsHours = children['LastsHours'].text
 
-                if scn.find('LastsMinutes') is not None:
-                    self.novel.scenes[scId].lastsMinutes = scn.find('LastsMinutes').text
+                if 'LastsMinutes' in children:
+                    scene.lastsMinutes = children['LastsMinutes'].text
 
-                if scn.find('ReactionScene') is not None:
-                    self.novel.scenes[scId].isReactionScene = True
-                else:
-                    self.novel.scenes[scId].isReactionScene = False
+                scene.isReactionScene = 'ReactionScene' in children
 
-                if scn.find('SubPlot') is not None:
-                    self.novel.scenes[scId].isSubPlot = True
-                else:
-                    self.novel.scenes[scId].isSubPlot = False
-
-                if scn.find('Goal') is not None:
-                    self.novel.scenes[scId].goal = scn.find('Goal').text
-
-                if scn.find('Conflict') is not None:
-                    self.novel.scenes[scId].conflict = scn.find('Conflict').text
-
-                if scn.find('Outcome') is not None:
-                    self.novel.scenes[scId].outcome = scn.find('Outcome').text
-
-                if scn.find('ImageFile') is not None:
-                    self.novel.scenes[scId].image = scn.find('ImageFile').text
-
-                if scn.find('Characters') is not None:
-                    for characters in scn.find('Characters').iter('CharID'):
-                        crId = characters.text
-                        if crId in self.novel.srtCharacters:
-                            if self.novel.scenes[scId].characters is None:
-                                self.novel.scenes[scId].characters = []
-                            self.novel.scenes[scId].characters.append(crId)
-
-                if scn.find('Locations') is not None:
-                    for locations in scn.find('Locations').iter('LocID'):
-                        lcId = locations.text
-                        if lcId in self.novel.srtLocations:
-                            if self.novel.scenes[scId].locations is None:
-                                self.novel.scenes[scId].locations = []
-                            self.novel.scenes[scId].locations.append(lcId)
-
-                if scn.find('Items') is not None:
-                    for items in scn.find('Items').iter('ItemID'):
-                        itId = items.text
-                        if itId in self.novel.srtItems:
-                            if self.novel.scenes[scId].items is None:
-                                self.novel.scenes[scId].items = []
-                            self.novel.scenes[scId].items.append(itId)
+                scene.isSubPlot = 'SubPlot' in children
+
+                if 'Goal' in children:
+                    scene.goal = children['Goal'].text
+
+                if 'Conflict' in children:
+                    scene.conflict = children['Conflict'].text
+
+                if 'Outcome' in children:
+                    scene.outcome = children['Outcome'].text
+
+                if 'ImageFile' in children:
+                    scene.image = children['ImageFile'].text
+
+                if 'Characters' in children:
+                    crIds = [crId.text for crId in children['Characters'].iter('CharID')
+                             if crId.text in characters]
+                    if crIds:
+                        scene.characters = crIds
+
+                if 'Locations' in children:
+                    lcIds = [lcId.text for lcId in children['Locations'].iter('LocID')
+                             if lcId.text in locations]
+                    if lcIds:
+                        scene.locations = lcIds
+
+                if 'Items' in children:
+                    itIds = [itId.text for itId in children['Items'].iter('ItemID')
+                             if itId.text in items]
+                    if itIds:
+                        scene.items = itIds
 
         def read_chapters(root):
             #--- Read attributes at chapter level from the xml element tree.
-            self.novel.srtChapters = []
+            kwVarNames = frozenset(self._CHP_KWVAR)
+            scenes = self.novel.scenes
+            self.novel.chapters = {}
             # This is necessary for re-reading.
-            for chp in root.iter('CHAPTER'):
-                chId = chp.find('ID').text
-                self.novel.chapters[chId] = Chapter()
-                self.novel.srtChapters.append(chId)
+            for chp in root.iterfind('CHAPTERS/CHAPTER'):
+                children = _get_children(chp)
+                chId = children['ID'].text
+                chapter = Chapter()
+                self.novel.chapters[chId] = chapter
 
-                if chp.find('Title') is not None:
-                    self.novel.chapters[chId].title = chp.find('Title').text
+                if 'Title' in children:
+                    chapter.title = children['Title'].text
 
-                if chp.find('Desc') is not None:
-                    self.novel.chapters[chId].desc = chp.find('Desc').text
+                if 'Desc' in children:
+                    chapter.desc = children['Desc'].text
 
-                if chp.find('SectionStart') is not None:
-                    self.novel.chapters[chId].chLevel = 1
-                else:
-                    self.novel.chapters[chId].chLevel = 0
+                chapter.chLevel = 1 if 'SectionStart' in children else 0
 
                 # This is how yWriter 7.1.3.0 reads the chapter type:
                 #
@@ -509,70 +597,59 @@ class Yw7File(File):
                 # Todo   | x      | x    | 2           | 2
                 # Unused | -1     | x    | x           | 3
 
-                self.novel.chapters[chId].chType = 0
-                if chp.find('Unused') is not None:
-                    yUnused = True
-                else:
-                    yUnused = False
-                if chp.find('ChapterType') is not None:
+                chapter.chType = 0
+                yUnused = 'Unused' in children
+                if 'ChapterType' in children:
                     # The file may be created with yWriter version 7.0.7.2+
-                    yChapterType = chp.find('ChapterType').text
+                    yChapterType = children['ChapterType'].text
                     if yChapterType == '2':
-                        self.novel.chapters[chId].chType = 2
+                        chapter.chType = 2
                     elif yChapterType == '1':
-                        self.novel.chapters[chId].chType = 1
+                        chapter.chType = 1
                     elif yUnused:
-                        self.novel.chapters[chId].chType = 3
+                        chapter.chType = 3
                 else:
                     # The file may be created with a yWriter version prior to 7.0.7.2
-                    if chp.find('Type') is not None:
-                        yType = chp.find('Type').text
+                    if 'Type' in children:
+                        yType = children['Type'].text
                         if yType == '1':
-                            self.novel.chapters[chId].chType = 1
+                            chapter.chType = 1
                         elif yUnused:
-                            self.novel.chapters[chId].chType = 3
+                            chapter.chType = 3
 
-                self.novel.chapters[chId].suppressChapterTitle = False
-                if self.novel.chapters[chId].title is not None:
-                    if self.novel.chapters[chId].title.startswith('@'):
-                        self.novel.chapters[chId].suppressChapterTitle = True
+                chapter.suppressChapterTitle = False
+                if chapter.title is not None:
+                    if chapter.title.startswith('@'):
+                        chapter.suppressChapterTitle = True
 
                 #--- Initialize custom keyword variables.
-                for fieldName in self._CHP_KWVAR:
-                    self.novel.chapters[chId].kwVar[fieldName] = None
+                kwVar = dict.fromkeys(self._CHP_KWVAR)
+                chapter.kwVar = kwVar
 
                 #--- Read chapter fields.
                 for chFields in chp.findall('Fields'):
-                    if chFields.find('Field_SuppressChapterTitle') is not None:
-                        if chFields.find('Field_SuppressChapterTitle').text == '1':
-                            self.novel.chapters[chId].suppressChapterTitle = True
-                    self.novel.chapters[chId].isTrash = False
-                    if chFields.find('Field_IsTrash') is not None:
-                        if chFields.find('Field_IsTrash').text == '1':
-                            self.novel.chapters[chId].isTrash = True
-                    self.novel.chapters[chId].suppressChapterBreak = False
-                    if chFields.find('Field_SuppressChapterBreak') is not None:
-                        if chFields.find('Field_SuppressChapterBreak').text == '1':
-                            self.novel.chapters[chId].suppressChapterBreak = True
+                    if chFields.findtext('Field_SuppressChapterTitle') == '1':
+                        chapter.suppressChapterTitle = True
+                    chapter.isTrash = False
+                    if chFields.findtext('Field_IsTrash') == '1':
+                        chapter.isTrash = True
+                    chapter.suppressChapterBreak = False
+                    if chFields.findtext('Field_SuppressChapterBreak') == '1':
+                        chapter.suppressChapterBreak = True
 
                     #--- Read chapter custom fields.
-                    for fieldName in self._CHP_KWVAR:
-                        field = chFields.find(fieldName)
-                        if field is not None:
-                            self.novel.chapters[chId].kwVar[fieldName] = field.text
+                    for field in chFields:
+                        if field.tag in kwVarNames:
+                            kwVar[field.tag] = field.text
 
                 #--- Read chapter's scene list.
-                self.novel.chapters[chId].srtScenes = []
-                if chp.find('Scenes') is not None:
-                    for scn in chp.find('Scenes').findall('ScID'):
-                        scId = scn.text
-                        if scId in self.novel.scenes:
-                            self.novel.chapters[chId].srtScenes.append(scId)
+                if 'Scenes' in children:
+                    chapter.srtScenes = [scId.text for scId in children['Scenes'].findall('ScID')
+                                         if scId.text in scenes]
+                else:
+                    chapter.srtScenes = []
 
         #--- Begin reading.
-        for field in self._PRJ_KWVAR:
-            self.novel.kwVar[field] = None
-
         if self.is_locked():
             raise Error(f'{_("yWriter seems to be open. Please close first")}.')
         try:
@@ -592,9 +669,10 @@ class Yw7File(File):
         self.adjust_scene_types()
 
         #--- Set custom instance variables.
-        for scId in self.novel.scenes:
-            self.novel.scenes[scId].scnArcs = self.novel.scenes[scId].kwVar.get('Field_SceneArcs', None)
-            self.novel.scenes[scId].scnStyle = self.novel.scenes[scId].kwVar.get('Field_SceneStyle', None)
+        for scene in self.novel.scenes.values():
+            kwVar = scene.kwVar
+            scene.scnArcs = kwVar.get('Field_SceneArcs', None)
+            scene.scnStyle = kwVar.get('Field_SceneStyle', None)
 
     def write(self):
         """Write instance variables to the yWriter xml file.
@@ -611,15 +689,14 @@ class Yw7File(File):
             self.novel.get_languages()
 
         #--- Get custom instance variables.
-        for scId in self.novel.scenes:
-            if self.novel.scenes[scId].scnArcs is not None:
-                self.novel.scenes[scId].kwVar['Field_SceneArcs'] = self.novel.scenes[scId].scnArcs
-            if self.novel.scenes[scId].scnStyle is not None:
-                self.novel.scenes[scId].kwVar['Field_SceneStyle'] = self.novel.scenes[scId].scnStyle
+        for scene in self.novel.scenes.values():
+            if scene.scnArcs is not None:
+                scene.kwVar['Field_SceneArcs'] = scene.scnArcs
+            if scene.scnStyle is not None:
+                scene.kwVar['Field_SceneStyle'] = scene.scnStyle
 
         self._build_element_tree()
         self._write_element_tree(self)
-        self._postprocess_xml_file(self.filePath)
 
     def is_locked(self):
         """Check whether the yw7 file is locked by yWriter.
@@ -627,47 +704,88 @@ class Yw7File(File):
         Return True if a .lock file placed by yWriter exists.
         Otherwise, return False. 
         """
-        return os.path.isfile(f'{self.filePath}.lock')
+        return os.path.isfile(self._lockPath)
 
     def _build_element_tree(self):
         """Modify the yWriter project attributes of an existing xml element tree."""
 
-        def set_element(parent, tag, text, index):
-            subelement = parent.find(tag)
+        def set_element(parent, children, tag, text, index):
+            # children -- dict of the parent's subelements, as returned by _get_children().
+            subelement = children.get(tag, None)
             if subelement is None:
                 if text is not None:
                     subelement = ET.Element(tag)
                     parent.insert(index, subelement)
                     subelement.text = text
+                    children[tag] = subelement
                     index += 1
             elif text is not None:
                 subelement.text = text
                 index += 1
             return index
 
+        def set_text(parent, tag, text, children=None):
+            # Set the text of the parent's subelement, appending the subelement if necessary.
+            # children -- optional tag index of the parent, as returned by _get_children().
+            if children is None:
+                subelement = parent.find(tag)
+            else:
+                subelement = children.get(tag, None)
+            if subelement is None:
+                subelement = ET.SubElement(parent, tag)
+                if children is not None:
+                    children[tag] = subelement
+            subelement.text = text
+
+        def set_text_fields(parent, children, fields, prjElement):
+            # Write the plain text fields listed as (tag, attribute) pairs; skip the ones not set.
+            for tag, attribute in fields:
+                text = getattr(prjElement, attribute)
+                if text is not None:
+                    set_text(parent, tag, text, children)
+
+        def set_flag(parent, children, tag, isSet):
+            # Write a yWriter flag element ('-1' if set; removed if not set).
+            if isSet:
+                if tag not in children:
+                    subelement = ET.SubElement(parent, tag)
+                    subelement.text = '-1'
+                    children[tag] = subelement
+            elif tag in children:
+                parent.remove(children.pop(tag))
+
+        def set_id_list(parent, children, listTag, idTag, ids):
+            # Replace the IDs in a list element, creating the list element if necessary.
+            idList = children.get(listTag, None)
+            if idList is None:
+                idList = ET.SubElement(parent, listTag)
+                children[listTag] = idList
+            else:
+                idList[:] = [child for child in idList if child.tag != idTag]
+                # One pass, instead of a remove() with its own search for each old ID.
+            for elementId in ids:
+                ET.SubElement(idList, idTag).text = elementId
+
         def build_scene_subtree(xmlScn, prjScn):
+            scnChildren = _get_children(xmlScn)
             i = 1
-            i = set_element(xmlScn, 'Title', prjScn.title, i)
+            i = set_element(xmlScn, scnChildren, 'Title', prjScn.title, i)
 
-            if xmlScn.find('BelongsToChID') is None:
-                for chId in self.novel.chapters:
-                    if scId in self.novel.chapters[chId].srtScenes:
-                        ET.SubElement(xmlScn, 'BelongsToChID').text = chId
-                        break
+            if 'BelongsToChID' not in scnChildren:
+                chId = sceneChapters.get(scId, None)
+                if chId is not None:
+                    ET.SubElement(xmlScn, 'BelongsToChID').text = chId
 
             if prjScn.desc is not None:
-                try:
-                    xmlScn.find('Desc').text = prjScn.desc
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Desc').text = prjScn.desc
+                set_text(xmlScn, 'Desc', prjScn.desc, scnChildren)
 
-            if xmlScn.find('SceneContent') is None:
+            if 'SceneContent' not in scnChildren:
                 ET.SubElement(xmlScn, 'SceneContent').text = prjScn.sceneContent
 
-            if xmlScn.find('WordCount') is None:
+            if 'WordCount' not in scnChildren:
                 ET.SubElement(xmlScn, 'WordCount').text = str(prjScn.wordCount)
 
-            if xmlScn.find('LetterCount') is None:
+            if 'LetterCount' not in scnChildren:
                 ET.SubElement(xmlScn, 'LetterCount').text = str(prjScn.letterCount)
 
             #--- Write scene type.
@@ -692,217 +810,85 @@ class Yw7File(File):
             yUnused, ySceneType = scTypeEncoding[prjScn.scType]
 
             # <Unused> (remove, if scene is "Normal").
-            if yUnused:
-                if xmlScn.find('Unused') is None:
-                    ET.SubElement(xmlScn, 'Unused').text = '-1'
-            elif xmlScn.find('Unused') is not None:
-                xmlScn.remove(xmlScn.find('Unused'))
+            set_flag(xmlScn, scnChildren, 'Unused', yUnused)
 
             # <Fields><Field_SceneType> (remove, if scene is "Normal")
-            scFields = xmlScn.find('Fields')
+            scFields = scnChildren.get('Fields', None)
             if scFields is not None:
                 fieldScType = scFields.find('Field_SceneType')
                 if ySceneType is None:
                     if fieldScType is not None:
                         scFields.remove(fieldScType)
+                elif fieldScType is None:
+                    ET.SubElement(scFields, 'Field_SceneType').text = ySceneType
                 else:
-                    try:
-                        fieldScType.text = ySceneType
-                    except(AttributeError):
-                        ET.SubElement(scFields, 'Field_SceneType').text = ySceneType
+                    fieldScType.text = ySceneType
             elif ySceneType is not None:
                 scFields = ET.SubElement(xmlScn, 'Fields')
                 ET.SubElement(scFields, 'Field_SceneType').text = ySceneType
 
             #--- Write scene custom fields.
+            kwVar = prjScn.kwVar
             for field in self._SCN_KWVAR:
-                if self.novel.scenes[scId].kwVar.get(field, None):
+                text = kwVar.get(field, None)
+                if text:
                     if scFields is None:
                         scFields = ET.SubElement(xmlScn, 'Fields')
-                    try:
-                        scFields.find(field).text = self.novel.scenes[scId].kwVar[field]
-                    except(AttributeError):
-                        ET.SubElement(scFields, field).text = self.novel.scenes[scId].kwVar[field]
+                    set_text(scFields, field, text)
                 elif scFields is not None:
-                    try:
-                        scFields.remove(scFields.find(field))
-                    except:
-                        pass
+                    subelement = scFields.find(field)
+                    if subelement is not None:
+                        scFields.remove(subelement)
 
             if prjScn.status is not None:
-                try:
-                    xmlScn.find('Status').text = str(prjScn.status)
-                except:
-                    ET.SubElement(xmlScn, 'Status').text = str(prjScn.status)
+                set_text(xmlScn, 'Status', str(prjScn.status), scnChildren)
 
             if prjScn.notes is not None:
-                try:
-                    xmlScn.find('Notes').text = prjScn.notes
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Notes').text = prjScn.notes
+                set_text(xmlScn, 'Notes', prjScn.notes, scnChildren)
 
             if prjScn.tags is not None:
-                try:
-                    xmlScn.find('Tags').text = list_to_string(prjScn.tags)
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Tags').text = list_to_string(prjScn.tags)
-
-            if prjScn.field1 is not None:
-                try:
-                    xmlScn.find('Field1').text = prjScn.field1
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Field1').text = prjScn.field1
-
-            if prjScn.field2 is not None:
-                try:
-                    xmlScn.find('Field2').text = prjScn.field2
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Field2').text = prjScn.field2
-
-            if prjScn.field3 is not None:
-                try:
-                    xmlScn.find('Field3').text = prjScn.field3
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Field3').text = prjScn.field3
-
-            if prjScn.field4 is not None:
-                try:
-                    xmlScn.find('Field4').text = prjScn.field4
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Field4').text = prjScn.field4
-
-            if prjScn.appendToPrev:
-                if xmlScn.find('AppendToPrev') is None:
-                    ET.SubElement(xmlScn, 'AppendToPrev').text = '-1'
-            elif xmlScn.find('AppendToPrev') is not None:
-                xmlScn.remove(xmlScn.find('AppendToPrev'))
+                set_text(xmlScn, 'Tags', list_to_string(prjScn.tags), scnChildren)
+
+            set_text_fields(xmlScn, scnChildren, self._SCN_RATING_FIELDS, prjScn)
+
+            set_flag(xmlScn, scnChildren, 'AppendToPrev', prjScn.appendToPrev)
 
             # Date/time information
             if (prjScn.date is not None) and (prjScn.time is not None):
                 dateTime = f'{prjScn.date} {prjScn.time}'
-                if xmlScn.find('SpecificDateTime') is not None:
-                    xmlScn.find('SpecificDateTime').text = dateTime
+                if 'SpecificDateTime' in scnChildren:
+                    scnChildren['SpecificDateTime'].text = dateTime
                 else:
                     ET.SubElement(xmlScn, 'SpecificDateTime').text = dateTime
                     ET.SubElement(xmlScn, 'SpecificDateMode').text = '-1'
 
-                    if xmlScn.find('Day') is not None:
-                        xmlScn.remove(xmlScn.find('Day'))
-
-                    if xmlScn.find('Hour') is not None:
-                        xmlScn.remove(xmlScn.find('Hour'))
-
-                    if xmlScn.find('Minute') is not None:
-                        xmlScn.remove(xmlScn.find('Minute'))
+                    for tag, __ in self._SCN_UNSPECIFIC_TIME_FIELDS:
+                        if tag in scnChildren:
+                            xmlScn.remove(scnChildren.pop(tag))
 
             elif (prjScn.day is not None) or (prjScn.hour is not None) or (prjScn.minute is not None):
+                for tag in ('SpecificDateTime', 'SpecificDateMode'):
+                    if tag in scnChildren:
+                        xmlScn.remove(scnChildren.pop(tag))
+                set_text_fields(xmlScn, scnChildren, self._SCN_UNSPECIFIC_TIME_FIELDS, prjScn)
 
-                if xmlScn.find('SpecificDateTime') is not None:
-                    xmlScn.remove(xmlScn.find('SpecificDateTime'))
-
-                if xmlScn.find('SpecificDateMode') is not None:
-                    xmlScn.remove(xmlScn.find('SpecificDateMode'))
-                if prjScn.day is not None:
-                    try:
-                        xmlScn.find('Day').text = prjScn.day
-                    except(AttributeError):
-                        ET.SubElement(xmlScn, 'Day').text = prjScn.day
-                if prjScn.hour is not None:
-                    try:
-                        xmlScn.find('Hour').text = prjScn.hour
-                    except(AttributeError):
-                        ET.SubElement(xmlScn, 'Hour').text = prjScn.hour
-                if prjScn.minute is not None:
-                    try:
-                        xmlScn.find('Minute').text = prjScn.minute
-                    except(AttributeError):
-                        ET.SubElement(xmlScn, 'Minute').text = prjScn.minute
-
-            if prjScn.lastsDays is not None:
-                try:
-                    xmlScn.find('LastsDays').text = prjScn.lastsDays
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'LastsDays').text = prjScn.lastsDays
-
-            if prjScn.lastsHours is not None:
-                try:
-                    xmlScn.find('LastsHours').text = prjScn.lastsHours
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'LastsHours').text = prjScn.lastsHours
-
-            if prjScn.lastsMinutes is not None:
-                try:
-                    xmlScn.find('LastsMinutes').text = prjScn.lastsMinutes
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'LastsMinutes').text = prjScn.lastsMinutes
+            set_text_fields(xmlScn, scnChildren, self._SCN_DURATION_FIELDS, prjScn)
 
             # Plot related information
-            if prjScn.isReactionScene:
-                if xmlScn.find('ReactionScene') is None:
-                    ET.SubElement(xmlScn, 'ReactionScene').text = '-1'
-            elif xmlScn.find('ReactionScene') is not None:
-                xmlScn.remove(xmlScn.find('ReactionScene'))
-
-            if prjScn.isSubPlot:
-                if xmlScn.find('SubPlot') is None:
-                    ET.SubElement(xmlScn, 'SubPlot').text = '-1'
-            elif xmlScn.find('SubPlot') is not None:
-                xmlScn.remove(xmlScn.find('SubPlot'))
-
-            if prjScn.goal is not None:
-                try:
-                    xmlScn.find('Goal').text = prjScn.goal
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Goal').text = prjScn.goal
-
-            if prjScn.conflict is not None:
-                try:
-                    xmlScn.find('Conflict').text = prjScn.conflict
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Conflict').text = prjScn.conflict
-
-            if prjScn.outcome is not None:
-                try:
-                    xmlScn.find('Outcome').text = prjScn.outcome
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'Outcome').text = prjScn.outcome
-
-            if prjScn.image is not None:
-                try:
-                    xmlScn.find('ImageFile').text = prjScn.image
-                except(AttributeError):
-                    ET.SubElement(xmlScn, 'ImageFile').text = prjScn.image
+            set_flag(xmlScn, scnChildren, 'ReactionScene', prjScn.isReactionScene)
+            set_flag(xmlScn, scnChildren, 'SubPlot', prjScn.isSubPlot)
+
+            set_text_fields(xmlScn, scnChildren, self._SCN_PLOT_FIELDS, prjScn)
 
             #--- Characters/locations/items
             if prjScn.characters is not None:
-                characters = xmlScn.find('Characters')
-                try:
-                    for oldCrId in characters.findall('CharID'):
-                        characters.remove(oldCrId)
-                except(AttributeError):
-                    characters = ET.SubElement(xmlScn, 'Characters')
-                for crId in prjScn.characters:
-                    ET.SubElement(characters, 'CharID').text = crId
+                set_id_list(xmlScn, scnChildren, 'Characters', 'CharID', prjScn.characters)
 
             if prjScn.locations is not None:
-                locations = xmlScn.find('Locations')
-                try:
-                    for oldLcId in locations.findall('LocID'):
-                        locations.remove(oldLcId)
-                except(AttributeError):
-                    locations = ET.SubElement(xmlScn, 'Locations')
-                for lcId in prjScn.locations:
-                    ET.SubElement(locations, 'LocID').text = lcId
+                set_id_list(xmlScn, scnChildren, 'Locations', 'LocID', prjScn.locations)
 
             if prjScn.items is not None:
-                items = xmlScn.find('Items')
-                try:
-                    for oldItId in items.findall('ItemID'):
-                        items.remove(oldItId)
-                except(AttributeError):
-                    items = ET.SubElement(xmlScn, 'Items')
-                for itId in prjScn.items:
-                    ET.SubElement(items, 'ItemID').text = itId
+                set_id_list(xmlScn, scnChildren, 'Items', 'ItemID', prjScn.items)
 
         def build_chapter_subtree(xmlChp, prjChp, sortOrder):
             # This is how yWriter 7.1.3.0 writes the chapter type:
@@ -924,94 +910,86 @@ class Yw7File(File):
                 prjChp.chType = 0
             yUnused, yType, yChapterType = chTypeEncoding[prjChp.chType]
 
+            chpChildren = _get_children(xmlChp)
             i = 1
-            i = set_element(xmlChp, 'Title', prjChp.title, i)
-            i = set_element(xmlChp, 'Desc', prjChp.desc, i)
+            i = set_element(xmlChp, chpChildren, 'Title', prjChp.title, i)
+            i = set_element(xmlChp, chpChildren, 'Desc', prjChp.desc, i)
 
+            unused = chpChildren.get('Unused', None)
             if yUnused:
-                if xmlChp.find('Unused') is None:
-                    elem = ET.Element('Unused')
-                    elem.text = '-1'
-                    xmlChp.insert(i, elem)
-            elif xmlChp.find('Unused') is not None:
-                xmlChp.remove(xmlChp.find('Unused'))
-            if xmlChp.find('Unused') is not None:
+                if unused is None:
+                    unused = ET.Element('Unused')
+                    unused.text = '-1'
+                    xmlChp.insert(i, unused)
+            elif unused is not None:
+                xmlChp.remove(unused)
+                unused = None
+            if unused is not None:
                 i += 1
 
-            i = set_element(xmlChp, 'SortOrder', str(sortOrder), i)
+            i = set_element(xmlChp, chpChildren, 'SortOrder', str(sortOrder), i)
 
             #--- Write chapter fields.
-            chFields = xmlChp.find('Fields')
-            if prjChp.suppressChapterTitle:
-                if chFields is None:
+            kwVar = prjChp.kwVar
+            chFields = chpChildren.get('Fields', None)
+            if chFields is None:
+                if (prjChp.suppressChapterTitle or prjChp.suppressChapterBreak or prjChp.isTrash
+                        or any(kwVar.get(field, None) for field in self._CHP_KWVAR)):
                     chFields = ET.Element('Fields')
                     xmlChp.insert(i, chFields)
-                try:
-                    chFields.find('Field_SuppressChapterTitle').text = '1'
-                except(AttributeError):
-                    ET.SubElement(chFields, 'Field_SuppressChapterTitle').text = '1'
+                    # Created only once, and only if there is something to write.
+
+            if prjChp.suppressChapterTitle:
+                set_text(chFields, 'Field_SuppressChapterTitle', '1')
             elif chFields is not None:
-                if chFields.find('Field_SuppressChapterTitle') is not None:
-                    chFields.find('Field_SuppressChapterTitle').text = '0'
+                subelement = chFields.find('Field_SuppressChapterTitle')
+                if subelement is not None:
+                    subelement.text = '0'
 
             if prjChp.suppressChapterBreak:
-                if chFields is None:
-                    chFields = ET.Element('Fields')
-                    xmlChp.insert(i, chFields)
-                try:
-                    chFields.find('Field_SuppressChapterBreak').text = '1'
-                except(AttributeError):
-                    ET.SubElement(chFields, 'Field_SuppressChapterBreak').text = '1'
+                set_text(chFields, 'Field_SuppressChapterBreak', '1')
             elif chFields is not None:
-                if chFields.find('Field_SuppressChapterBreak') is not None:
-                    chFields.find('Field_SuppressChapterBreak').text = '0'
+                subelement = chFields.find('Field_SuppressChapterBreak')
+                if subelement is not None:
+                    subelement.text = '0'
 
             if prjChp.isTrash:
-                if chFields is None:
-                    chFields = ET.Element('Fields')
-                    xmlChp.insert(i, chFields)
-                try:
-                    chFields.find('Field_IsTrash').text = '1'
-                except(AttributeError):
-                    ET.SubElement(chFields, 'Field_IsTrash').text = '1'
+                set_text(chFields, 'Field_IsTrash', '1')
 
             elif chFields is not None:
-                if chFields.find('Field_IsTrash') is not None:
-                    chFields.remove(chFields.find('Field_IsTrash'))
+                subelement = chFields.find('Field_IsTrash')
+                if subelement is not None:
+                    chFields.remove(subelement)
 
             #--- Write chapter custom fields.
             for field in self._CHP_KWVAR:
-                if prjChp.kwVar.get(field, None):
-                    if chFields is None:
-                        chFields = ET.Element('Fields')
-                        xmlChp.insert(i, chFields)
-                    try:
-                        chFields.find(field).text = prjChp.kwVar[field]
-                    except(AttributeError):
-                        ET.SubElement(chFields, field).text = prjChp.kwVar[field]
+                text = kwVar.get(field, None)
+                if text:
+                    set_text(chFields, field, text)
                 elif chFields is not None:
-                    try:
-                        chFields.remove(chFields.find(field))
-                    except:
-                        pass
-            if xmlChp.find('Fields') is not None:
+                    subelement = chFields.find(field)
+                    if subelement is not None:
+                        chFields.remove(subelement)
+            if chFields is not None:
                 i += 1
 
-            if xmlChp.find('SectionStart') is not None:
+            sectionStart = chpChildren.get('SectionStart', None)
+            if sectionStart is not None:
                 if prjChp.chLevel == 0:
-                    xmlChp.remove(xmlChp.find('SectionStart'))
+                    xmlChp.remove(sectionStart)
+                    sectionStart = None
             elif prjChp.chLevel == 1:
-                elem = ET.Element('SectionStart')
-                elem.text = '-1'
-                xmlChp.insert(i, elem)
-            if xmlChp.find('SectionStart') is not None:
+                sectionStart = ET.Element('SectionStart')
+                sectionStart.text = '-1'
+                xmlChp.insert(i, sectionStart)
+            if sectionStart is not None:
                 i += 1
 
-            i = set_element(xmlChp, 'Type', yType, i)
-            i = set_element(xmlChp, 'ChapterType', yChapterType, i)
+            i = set_element(xmlChp, chpChildren, 'Type', yType, i)
+            i = set_element(xmlChp, chpChildren, 'ChapterType', yChapterType, i)
 
             #--- Rebuild the chapter's scene list.
-            xmlScnList = xmlChp.find('Scenes')
+            xmlScnList = chpChildren.get('Scenes', None)
 
             # Remove the Scenes section.
             if xmlScnList is not None:
@@ -1044,19 +1022,17 @@ class Yw7File(File):
 
             #--- Write location custom fields.
             lcFields = xmlLoc.find('Fields')
+            kwVar = prjLoc.kwVar
             for field in self._LOC_KWVAR:
-                if self.novel.locations[lcId].kwVar.get(field, None):
+                text = kwVar.get(field, None)
+                if text:
                     if lcFields is None:
                         lcFields = ET.SubElement(xmlLoc, 'Fields')
-                    try:
-                        lcFields.find(field).text = self.novel.locations[lcId].kwVar[field]
-                    except(AttributeError):
-                        ET.SubElement(lcFields, field).text = self.novel.locations[lcId].kwVar[field]
+                    set_text(lcFields, field, text)
                 elif lcFields is not None:
-                    try:
-                        lcFields.remove(lcFields.find(field))
-                    except:
-                        pass
+                    subelement = lcFields.find(field)
+                    if subelement is not None:
+                        lcFields.remove(subelement)
 
         def build_prjNote_subtree(xmlPnt, prjPnt, sortOrder):
             if prjPnt.title is not None:
@@ -1071,7 +1047,7 @@ class Yw7File(File):
             # Note:
             # prjVars, projectvars are caller's variables
             pvId = create_id(prjVars)
-            prjVars.append(pvId)
+            prjVars.add(pvId)
             # side effect
             projectvar = ET.SubElement(projectvars, 'PROJECTVAR')
             ET.SubElement(projectvar, 'ID').text = pvId
@@ -1099,19 +1075,17 @@ class Yw7File(File):
 
             #--- Write item custom fields.
             itFields = xmlItm.find('Fields')
+            kwVar = prjItm.kwVar
             for field in self._ITM_KWVAR:
-                if self.novel.items[itId].kwVar.get(field, None):
+                text = kwVar.get(field, None)
+                if text:
                     if itFields is None:
                         itFields = ET.SubElement(xmlItm, 'Fields')
-                    try:
-                        itFields.find(field).text = self.novel.items[itId].kwVar[field]
-                    except(AttributeError):
-                        ET.SubElement(itFields, field).text = self.novel.items[itId].kwVar[field]
+                    set_text(itFields, field, text)
                 elif itFields is not None:
-                    try:
-                        itFields.remove(itFields.find(field))
-                    except:
-                        pass
+                    subelement = itFields.find(field)
+                    if subelement is not None:
+                        itFields.remove(subelement)
 
         def build_character_subtree(xmlCrt, prjCrt, sortOrder):
             if prjCrt.title is not None:
@@ -1148,87 +1122,31 @@ class Yw7File(File):
 
             #--- Write character custom fields.
             crFields = xmlCrt.find('Fields')
+            kwVar = prjCrt.kwVar
             for field in self._CRT_KWVAR:
-                if self.novel.characters[crId].kwVar.get(field, None):
+                text = kwVar.get(field, None)
+                if text:
                     if crFields is None:
                         crFields = ET.SubElement(xmlCrt, 'Fields')
-                    try:
-                        crFields.find(field).text = self.novel.characters[crId].kwVar[field]
-                    except(AttributeError):
-                        ET.SubElement(crFields, field).text = self.novel.characters[crId].kwVar[field]
+                    set_text(crFields, field, text)
                 elif crFields is not None:
-                    try:
-                        crFields.remove(crFields.find(field))
-                    except:
-                        pass
+                    subelement = crFields.find(field)
+                    if subelement is not None:
+                        crFields.remove(subelement)
 
         def build_project_subtree(xmlPrj):
+            prjChildren = _get_children(xmlPrj)
             VER = '7'
-            try:
-                xmlPrj.find('Ver').text = VER
-            except(AttributeError):
-                ET.SubElement(xmlPrj, 'Ver').text = VER
-
-            if self.novel.title is not None:
-                try:
-                    xmlPrj.find('Title').text = self.novel.title
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'Title').text = self.novel.title
-
-            if self.novel.desc is not None:
-                try:
-                    xmlPrj.find('Desc').text = self.novel.desc
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'Desc').text = self.novel.desc
-
-            if self.novel.authorName is not None:
-                try:
-                    xmlPrj.find('AuthorName').text = self.novel.authorName
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'AuthorName').text = self.novel.authorName
-
-            if self.novel.authorBio is not None:
-                try:
-                    xmlPrj.find('Bio').text = self.novel.authorBio
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'Bio').text = self.novel.authorBio
-
-            if self.novel.fieldTitle1 is not None:
-                try:
-                    xmlPrj.find('FieldTitle1').text = self.novel.fieldTitle1
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'FieldTitle1').text = self.novel.fieldTitle1
-
-            if self.novel.fieldTitle2 is not None:
-                try:
-                    xmlPrj.find('FieldTitle2').text = self.novel.fieldTitle2
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'FieldTitle2').text = self.novel.fieldTitle2
-
-            if self.novel.fieldTitle3 is not None:
-                try:
-                    xmlPrj.find('FieldTitle3').text = self.novel.fieldTitle3
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'FieldTitle3').text = self.novel.fieldTitle3
-
-            if self.novel.fieldTitle4 is not None:
-                try:
-                    xmlPrj.find('FieldTitle4').text = self.novel.fieldTitle4
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'FieldTitle4').text = self.novel.fieldTitle4
+            set_text(xmlPrj, 'Ver', VER, prjChildren)
+
+            set_text_fields(xmlPrj, prjChildren, self._PRJ_TEXT_FIELDS, self.novel)
 
             #--- Write word target data.
             if self.novel.wordCountStart is not None:
-                try:
-                    xmlPrj.find('WordCountStart').text = str(self.novel.wordCountStart)
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'WordCountStart').text = str(self.novel.wordCountStart)
+                set_text(xmlPrj, 'WordCountStart', str(self.novel.wordCountStart), prjChildren)
 
             if self.novel.wordTarget is not None:
-                try:
-                    xmlPrj.find('WordTarget').text = str(self.novel.wordTarget)
-                except(AttributeError):
-                    ET.SubElement(xmlPrj, 'WordTarget').text = str(self.novel.wordTarget)
+                set_text(xmlPrj, 'WordTarget', str(self.novel.wordTarget), prjChildren)
 
             #--- Write project custom fields.
 
@@ -1236,36 +1154,33 @@ class Yw7File(File):
             self.novel.kwVar['Field_LanguageCode'] = None
             self.novel.kwVar['Field_CountryCode'] = None
 
-            prjFields = xmlPrj.find('Fields')
+            prjFields = prjChildren.get('Fields', None)
             for field in self._PRJ_KWVAR:
                 setting = self.novel.kwVar.get(field, None)
                 if setting:
                     if prjFields is None:
                         prjFields = ET.SubElement(xmlPrj, 'Fields')
-                    try:
-                        prjFields.find(field).text = setting
-                    except(AttributeError):
-                        ET.SubElement(prjFields, field).text = setting
-                else:
-                    try:
-                        prjFields.remove(prjFields.find(field))
-                    except:
-                        pass
+                    set_text(prjFields, field, setting)
+                elif prjFields is not None:
+                    subelement = prjFields.find(field)
+                    if subelement is not None:
+                        prjFields.remove(subelement)
 
         TAG = 'YWRITER7'
         xmlScenes = {}
         xmlChapters = {}
-        try:
-            # Try processing an existing tree.
+        if self.tree is not None:
+            # Process an existing tree.
             root = self.tree.getroot()
-            xmlPrj = root.find('PROJECT')
-            locations = root.find('LOCATIONS')
-            items = root.find('ITEMS')
-            characters = root.find('CHARACTERS')
-            prjNotes = root.find('PROJECTNOTES')
-            scenes = root.find('SCENES')
-            chapters = root.find('CHAPTERS')
-        except(AttributeError):
+            rootChildren = _get_children(root)
+            xmlPrj = rootChildren.get('PROJECT', None)
+            locations = rootChildren.get('LOCATIONS', None)
+            items = rootChildren.get('ITEMS', None)
+            characters = rootChildren.get('CHARACTERS', None)
+            prjNotes = rootChildren.get('PROJECTNOTES', None)
+            scenes = rootChildren.get('SCENES', None)
+            chapters = rootChildren.get('CHAPTERS', None)
+        else:
             # Build a new tree.
             root = ET.Element(TAG)
             xmlPrj = ET.SubElement(root, 'PROJECT')
@@ -1332,11 +1247,11 @@ class Yw7File(File):
         if prjNotes is not None:
             for xmlPnt in prjNotes.findall('PROJECTNOTE'):
                 prjNotes.remove(xmlPnt)
-            if not self.novel.srtPrjNotes:
+            if not self.novel.projectNotes:
                 root.remove(prjNotes)
-        elif self.novel.srtPrjNotes:
+        elif self.novel.projectNotes:
             prjNotes = ET.SubElement(root, 'PROJECTNOTES')
-        if self.novel.srtPrjNotes:
+        if self.novel.projectNotes:
             # Add the new XML prjNote subtrees to the project tree.
             sortOrder = 0
             for pnId in self.novel.srtPrjNotes:
@@ -1351,22 +1266,20 @@ class Yw7File(File):
             projectvars = root.find('PROJECTVARS')
             if projectvars is None:
                 projectvars = ET.SubElement(root, 'PROJECTVARS')
-            prjVars = []
-            # list of all project variable IDs
-            languages = self.novel.languages.copy()
+            prjVars = set()
+            # set of all project variable IDs; create_id() tests membership for each candidate ID
+            languages = dict.fromkeys(self.novel.languages)
+            # dict used as an ordered set of the language codes still missing a project variable.
             hasLanguageCode = False
             hasCountryCode = False
             for projectvar in projectvars.findall('PROJECTVAR'):
-                prjVars.append(projectvar.find('ID').text)
+                prjVars.add(projectvar.find('ID').text)
                 title = projectvar.find('Title').text
 
                 # Collect language codes.
                 if title.startswith('lang='):
-                    try:
-                        __, langCode = title.split('=')
-                        languages.remove(langCode)
-                    except:
-                        pass
+                    __, __, langCode = title.partition('=')
+                    languages.pop(langCode, None)
 
                 # Get the document's locale.
                 elif title == 'Language':
@@ -1396,7 +1309,7 @@ class Yw7File(File):
                 add_projectvariable(f'/lang={langCode}',
                                     f'<HTM </SPAN> /HTM>',
                                     '0')
-                # adding new IDs to the prjVars list
+                # adding new IDs to the prjVars set
 
         #--- Process scenes.
 
@@ -1407,6 +1320,12 @@ class Yw7File(File):
             xmlScenes[scId] = xmlScn
             scenes.remove(xmlScn)
 
+        # Assign each scene to the first chapter containing it.
+        sceneChapters = {}
+        for chId in self.novel.chapters:
+            for scId in self.novel.chapters[chId].srtScenes:
+                sceneChapters.setdefault(scId, chId)
+
         # Add the new XML scene subtrees to the project tree.
         for scId in self.novel.scenes:
             if not scId in xmlScenes:
@@ -1435,16 +1354,16 @@ class Yw7File(File):
             chapters.append(xmlChapters[chId])
 
         # Modify the scene contents of an existing xml element tree.
-        for scn in root.iter('SCENE'):
-            scId = scn.find('ID').text
-            if self.novel.scenes[scId].sceneContent is not None:
-                scn.find('SceneContent').text = self.novel.scenes[scId].sceneContent
-                scn.find('WordCount').text = str(self.novel.scenes[scId].wordCount)
-                scn.find('LetterCount').text = str(self.novel.scenes[scId].letterCount)
-            try:
-                scn.remove(scn.find('RTFFile'))
-            except:
-                pass
+        for scId, prjScn in self.novel.scenes.items():
+            scn = xmlScenes[scId]
+            # These are exactly the SCENE elements in the tree, so there's no need to search it.
+            scnChildren = _get_children(scn)
+            if prjScn.sceneContent is not None:
+                scnChildren['SceneContent'].text = prjScn.sceneContent
+                scnChildren['WordCount'].text = str(prjScn.wordCount)
+                scnChildren['LetterCount'].text = str(prjScn.letterCount)
+            if 'RTFFile' in scnChildren:
+                scn.remove(scnChildren['RTFFile'])
 
         indent(root)
         self.tree = ET.ElementTree(root)
@@ -1452,18 +1371,36 @@ class Yw7File(File):
     def _write_element_tree(self, ywProject):
         """Write back the xml element tree to a .yw7 xml file located at filePath.
         
+        The tree is serialized and postprocessed in memory,
+        so the file is written only once.
         Raise the "Error" exception in case of error. 
         """
+        xmlBuffer = BytesIO()
+        try:
+            ywProject.tree.write(xmlBuffer, xml_declaration=False, encoding='utf-8')
+        except:
+            raise Error(f'{_("Cannot write file")}: "{norm_path(ywProject.filePath)}".')
+        xmlBuffer.seek(0)
+        with TextIOWrapper(xmlBuffer, encoding='utf-8') as f:
+            text = f.read()
+            # Decoded with universal newlines, like reading back a written file.
+        text = self._postprocess_xml(text)
         backedUp = False
-        if os.path.isfile(ywProject.filePath):
-            try:
-                os.replace(ywProject.filePath, f'{ywProject.filePath}.bak')
-            except:
-                raise Error(f'{_("Cannot overwrite file")}: "{norm_path(ywProject.filePath)}".')
-            else:
-                backedUp = True
         try:
-            ywProject.tree.write(ywProject.filePath, xml_declaration=False, encoding='utf-8')
+            os.replace(ywProject.filePath, f'{ywProject.filePath}.bak')
+        except FileNotFoundError:
+            # This is a new file, so there is nothing to back up.
+            pass
+        except:
+            raise Error(f'{_("Cannot overwrite file")}: "{norm_path(ywProject.filePath)}".')
+        else:
+            backedUp = True
+        try:
+            with open(ywProject.filePath, 'w', encoding='utf-8') as f:
+                f.write(text)
+                if ywProject.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
         except:
             if backedUp:
                 os.replace(f'{ywProject.filePath}.bak', ywProject.filePath)
@@ -1484,23 +1421,32 @@ class Yw7File(File):
         '''
         with open(filePath, 'r', encoding='utf-8') as f:
             text = f.read()
-        lines = text.split('\n')
-        newlines = ['<?xml version="1.0" encoding="utf-8"?>']
-        for line in lines:
-            for tag in self._CDATA_TAGS:
-                line = re.sub(f'\<{tag}\>', f'<{tag}><![CDATA[', line)
-                line = re.sub(f'\<\/{tag}\>', f']]></{tag}>', line)
-            newlines.append(line)
-        text = '\n'.join(newlines)
-        text = text.replace('[CDATA[ \n', '[CDATA[')
-        text = text.replace('\n]]', ']]')
-        text = unescape(text)
+        text = self._postprocess_xml(text)
         try:
             with open(filePath, 'w', encoding='utf-8') as f:
                 f.write(text)
         except:
             raise Error(f'{_("Cannot write file")}: "{norm_path(filePath)}".')
 
+    def _postprocess_xml(self, text):
+        '''Return the postprocessed text of an xml file created by ElementTree.
+        
+        Positional argument:
+            text -- str: xml file content.
+        
+        Put a header on top, insert the missing CDATA tags,
+        and replace xml entities by plain text (unescape).
+        '''
+        text = self._CDATA_OPENING_TAG.sub(r'<\1><![CDATA[', text)
+        text = self._CDATA_CLOSING_TAG.sub(r']]></\1>', text)
+        # One pass over the whole text per direction, instead of two substitutions per tag and line.
+        # The tags can't span lines, so the result is the same.
+        text = f'<?xml version="1.0" encoding="utf-8"?>\n{text}'
+        text = text.replace('[CDATA[ \n', '[CDATA[')
+        text = text.replace('\n]]', ']]')
+        text = unescape(text)
+        return text
+
     def _strip_spaces(self, lines):
         """Local helper method.
 
@@ -1509,10 +1455,7 @@ class Yw7File(File):
 
         Return lines with leading and trailing spaces removed.
         """
-        stripped = []
-        for line in lines:
-            stripped.append(line.strip())
-        return stripped
+        return [line.strip() for line in lines]
 
     def reset_custom_variables(self):
         """Set custom keyword variables to an empty string.
@@ -1521,22 +1464,23 @@ class Yw7File(File):
         from the .yw7 XML file. 
         Return True, if a keyword variable has changed (i.e information is lost).
         """
-        hasChanged = False
-        for field in self._PRJ_KWVAR:
-            if self.novel.kwVar.get(field, None):
-                self.novel.kwVar[field] = ''
-                hasChanged = True
-        for chId in self.novel.chapters:
-            # Deliberatey not iterate srtChapters: make sure to get all chapters.
-            for field in self._CHP_KWVAR:
-                if self.novel.chapters[chId].kwVar.get(field, None):
-                    self.novel.chapters[chId].kwVar[field] = ''
-                    hasChanged = True
-        for scId in self.novel.scenes:
-            for field in self._SCN_KWVAR:
-                if self.novel.scenes[scId].kwVar.get(field, None):
-                    self.novel.scenes[scId].kwVar[field] = ''
-                    hasChanged = True
+
+        def reset_fields(kwVar, fields):
+            # Set the fields that are not empty to an empty string. Return True, if there were any.
+            setFields = [field for field in fields if kwVar.get(field, None)]
+            if setFields:
+                kwVar.update(dict.fromkeys(setFields, ''))
+                return True
+            return False
+
+        hasChanged = reset_fields(self.novel.kwVar, self._PRJ_KWVAR)
+        if self._CHP_KWVAR:
+            for chapter in self.novel.chapters.values():
+                # Deliberatey not iterate srtChapters: make sure to get all chapters.
+                hasChanged = reset_fields(chapter.kwVar, self._CHP_KWVAR) or hasChanged
+        if self._SCN_KWVAR:
+            for scene in self.novel.scenes.values():
+                hasChanged = reset_fields(scene.kwVar, self._SCN_KWVAR) or hasChanged
         return hasChanged
 
     def adjust_scene_types(self):
@@ -18,15 +18,17 @@ class Node(tk.Label):
     """
     isModified = False
 
-    def __init__(self, master, colorFalse='white', colorTrue='black', cnf={}, **kw):
+    def __init__(self, master, colorFalse='white', colorTrue='black', onChange=None, cnf={}, **kw):
         """Place the node to the master widget.
         
         Optional arguments:
             colorFalse -- str: node color when status is False.
             colorTrue -- str: node color when status is True.
+            onChange -- callable without arguments: called when the node is clicked on.
         """
         self.colorTrue = colorTrue
         self.colorFalse = colorFalse
+        self.onChange = onChange
         self._state = False
         super().__init__(master, cnf, **kw)
         self._set_color()
@@ -50,3 +52,5 @@ class Node(tk.Label):
     def _toggle_state(self, event=None):
         self.state = not self._state
         Node.isModified = True
+        if self.onChange is not None:
+            self.onChange()
@@ -4,6 +4,7 @@ Copyright (c) 2022 Peter Triesberger
 For further information see https://github.com/peter88213/yw-table
 License: GNU GPLv3 (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
+from functools import partial
 import tkinter as tk
 from ywtablelib.ywtable_globals import *
 from ywtablelib.node import Node
@@ -14,12 +15,13 @@ class RelationsTable:
     
     Public methods:
         set_nodes -- Loop through all nodes, setting states.
-        get_nodes -- Loop through all nodes, modifying the scenes according to the states.
+        get_nodes -- Loop through the nodes of the modified scenes, changing the scenes according to the states.
     
     The visual part consists of one frame per column, each containing 
     one node per row. 
     The logical part consists of one dictionary per element type (protected instance variables):
     {scene ID: {element Id: node}}
+    The IDs of the scenes whose nodes were clicked on are collected in a set.
     """
 
     def __init__(self, master, novel):
@@ -44,6 +46,9 @@ class RelationsTable:
         self._characterNodes = {}
         self._locationNodes = {}
         self._itemNodes = {}
+        self._modifiedScenes = set()
+        onChange = {}
+        # key: scene ID, value: callback for the scene's nodes, adding the ID to _modifiedScenes.
         for chId in self._novel.chapters:
             for scId in self._novel.chapters[chId].srtScenes:
                 bgr = row % 2
@@ -55,6 +60,7 @@ class RelationsTable:
                 self._locationNodes[scId] = {}
                 self._itemNodes[scId] = {}
                 self._arcNodes[scId] = {}
+                onChange[scId] = partial(self._modifiedScenes.add, scId)
 
                 tk.Label(master.rowTitles,
                          text=self._novel.scenes[scId].title,
@@ -73,22 +79,23 @@ class RelationsTable:
                          ).pack(fill=tk.X)
 
         #--- Arc columns.
-        self._arcs = []
+        arcs = {}
+        # dict used as an ordered set: arc titles in order of first occurrence.
         self._scnArcs = {}
         for scId in self._arcNodes:
             if self._novel.scenes[scId].scnArcs:
                 self._scnArcs[scId] = string_to_list(self._novel.scenes[scId].scnArcs)
-                for arc in self._scnArcs[scId]:
-                    if not arc in self._arcs:
-                        self._arcs.append(arc)
+                arcs.update(dict.fromkeys(self._scnArcs[scId]))
             else:
                 self._scnArcs[scId] = []
+        self._arcs = list(arcs)
+        self._scnArcSets = {scId: frozenset(scnArcs) for scId, scnArcs in self._scnArcs.items()}
+        # Per-scene arc sets for constant-time membership tests.
         if self._arcs:
             arcTitleWindow = tk.Frame(master.columnTitles)
             arcTitleWindow.pack(side=tk.LEFT, fill=tk.BOTH)
             tk.Label(arcTitleWindow, text=_('Arcs'), bg=colorsArc[1][1]).pack(fill=tk.X)
             arcTypeColumn = tk.Frame(master.display)
-            arcTypeColumn.pack(side=tk.LEFT, fill=tk.BOTH)
             arcColumn = tk.Frame(arcTypeColumn)
             arcColumn.pack(fill=tk.BOTH)
             for arc in self._arcs:
@@ -111,7 +118,8 @@ class RelationsTable:
                     bgr = row % 2
                     node = Node(columns[col],
                          colorFalse=colorsBackground[bgr][bgc],
-                         colorTrue=colorsArc[bgr][bgc]
+                         colorTrue=colorsArc[bgr][bgc],
+                         onChange=onChange[scId]
                          )
                     node.pack(fill=tk.X, expand=True)
                     self._arcNodes[scId][arc] = node
@@ -125,11 +133,13 @@ class RelationsTable:
                          ).pack(fill=tk.X, expand=True)
                 col += 1
             tk.Label(arcTypeColumn, text=_('Arcs'), bg=colorsArc[1][1]).pack(fill=tk.X)
+            arcTypeColumn.pack(side=tk.LEFT, fill=tk.BOTH)
+            # Like the other element type columns, it is packed when it is complete.
+            # So filling it doesn't notify the display frame of a requested size change per node.
 
         #--- Character columns.
         if self._novel.characters:
             characterTypeColumn = tk.Frame(master.display)
-            characterTypeColumn.pack(side=tk.LEFT, fill=tk.BOTH)
             characterColumn = tk.Frame(characterTypeColumn)
             characterColumn.pack(fill=tk.BOTH)
             characterTitleWindow = tk.Frame(master.columnTitles)
@@ -155,7 +165,8 @@ class RelationsTable:
                     bgr = row % 2
                     node = Node(columns[col],
                          colorFalse=colorsBackground[bgr][bgc],
-                         colorTrue=colorsCharacter[bgr][bgc]
+                         colorTrue=colorsCharacter[bgr][bgc],
+                         onChange=onChange[scId]
                          )
                     node.pack(fill=tk.X, expand=True)
                     self._characterNodes[scId][crId] = node
@@ -169,11 +180,11 @@ class RelationsTable:
                          ).pack(fill=tk.X, expand=True)
                 col += 1
             tk.Label(characterTypeColumn, text=_('Characters'), bg=colorsCharacter[1][1]).pack(fill=tk.X)
+            characterTypeColumn.pack(side=tk.LEFT, fill=tk.BOTH)
 
         #--- Location columns.
         if self._novel.locations:
             locationTypeColumn = tk.Frame(master.display)
-            locationTypeColumn.pack(side=tk.LEFT, fill=tk.BOTH)
             locationColumn = tk.Frame(locationTypeColumn)
             locationColumn.pack(fill=tk.BOTH)
             locationTitleWindow = tk.Frame(master.columnTitles)
@@ -199,7 +210,8 @@ class RelationsTable:
                     bgr = row % 2
                     node = Node(columns[col],
                          colorFalse=colorsBackground[bgr][bgc],
-                         colorTrue=colorsLocation[bgr][bgc]
+                         colorTrue=colorsLocation[bgr][bgc],
+                         onChange=onChange[scId]
                          )
                     node.pack(fill=tk.X, expand=True)
                     self._locationNodes[scId][lcId] = node
@@ -213,11 +225,11 @@ class RelationsTable:
                          ).pack(fill=tk.X, expand=True)
                 col += 1
             tk.Label(locationTypeColumn, text=_('Locations'), bg=colorsLocation[1][1]).pack(fill=tk.X)
+            locationTypeColumn.pack(side=tk.LEFT, fill=tk.BOTH)
 
         #--- Item columns.
         if self._novel.items:
             itemTypeColumn = tk.Frame(master.display)
-            itemTypeColumn.pack(side=tk.LEFT, fill=tk.BOTH)
             itemColumn = tk.Frame(itemTypeColumn)
             itemColumn.pack(fill=tk.BOTH)
             itemTitleWindow = tk.Frame(master.columnTitles)
@@ -243,7 +255,8 @@ class RelationsTable:
                     bgr = row % 2
                     node = Node(columns[col],
                          colorFalse=colorsBackground[bgr][bgc],
-                         colorTrue=colorsItem[bgr][bgc]
+                         colorTrue=colorsItem[bgr][bgc],
+                         onChange=onChange[scId]
                          )
                     node.pack(fill=tk.X, expand=True)
                     self._itemNodes[scId][itId] = node
@@ -257,81 +270,52 @@ class RelationsTable:
                          ).pack(fill=tk.X, expand=True)
                 col += 1
             tk.Label(itemTypeColumn, text=_('Items'), bg=colorsItem[1][1]).pack(fill=tk.X)
+            itemTypeColumn.pack(side=tk.LEFT, fill=tk.BOTH)
 
     def set_nodes(self):
         """Loop through all nodes, setting states."""
-        for scId in self._arcNodes:
-            for arc in self._arcs:
-                try:
-                    self._arcNodes[scId][arc].state = (arc in self._scnArcs[scId])
-                except TypeError:
-                    pass
-
-        for scId in self._characterNodes:
-            for crId in self._novel.characters:
-                try:
-                    self._characterNodes[scId][crId].state = (crId in self._novel.scenes[scId].characters)
-                except TypeError:
-                    pass
-
-        for scId in self._locationNodes:
-            for lcId in self._novel.locations:
-                try:
-                    self._locationNodes[scId][lcId].state = (lcId in self._novel.scenes[scId].locations)
-                except TypeError:
-                    pass
-
-        for scId in self._itemNodes:
-            for itId in self._novel.items:
-                try:
-                    self._itemNodes[scId][itId].state = (itId in self._novel.scenes[scId].items)
-                except TypeError:
-                    pass
+        scenes = self._novel.scenes
+        arcs = self._arcs
+        characters = self._novel.characters
+        locations = self._novel.locations
+        items = self._novel.items
+        for scId, arcNodes in self._arcNodes.items():
+            scene = scenes[scId]
+            scnArcs = self._scnArcSets[scId]
+            for arc in arcs:
+                arcNodes[arc].state = (arc in scnArcs)
+            if scene.characters is not None:
+                scnCharacters = set(scene.characters)
+                characterNodes = self._characterNodes[scId]
+                for crId in characters:
+                    characterNodes[crId].state = (crId in scnCharacters)
+            if scene.locations is not None:
+                scnLocations = set(scene.locations)
+                locationNodes = self._locationNodes[scId]
+                for lcId in locations:
+                    locationNodes[lcId].state = (lcId in scnLocations)
+            if scene.items is not None:
+                scnItems = set(scene.items)
+                itemNodes = self._itemNodes[scId]
+                for itId in items:
+                    itemNodes[itId].state = (itId in scnItems)
 
     def get_nodes(self):
-        """Loop through all nodes, modifying the scenes according to the states."""
-        for scId in self._arcNodes:
-            arcs = []
-            for arc in self._arcs:
-                try:
-                    node = self._arcNodes[scId][arc]
-                except TypeError:
-                    pass
-                else:
-                    if node.state:
-                        arcs.append(arc)
-            self._novel.scenes[scId].scnArcs = list_to_string(arcs)
-
-        for scId in self._characterNodes:
-            self._novel.scenes[scId].characters = []
-            for crId in self._novel.characters:
-                try:
-                    node = self._characterNodes[scId][crId]
-                except TypeError:
-                    pass
-                else:
-                    if node.state:
-                        self._novel.scenes[scId].characters.append(crId)
-
-        for scId in self._locationNodes:
-            self._novel.scenes[scId].locations = []
-            for lcId in self._novel.locations:
-                try:
-                    node = self._locationNodes[scId][lcId]
-                except TypeError:
-                    pass
-                else:
-                    if node.state:
-                        self._novel.scenes[scId].locations.append(lcId)
-
-        for scId in self._itemNodes:
-            self._novel.scenes[scId].items = []
-            for itId in self._novel.items:
-                try:
-                    node = self._itemNodes[scId][itId]
-                except TypeError:
-                    pass
-                else:
-                    if node.state:
-                        self._novel.scenes[scId].items.append(itId)
+        """Loop through the nodes of the modified scenes, changing the scenes according to the states."""
+        scenes = self._novel.scenes
+        arcs = self._arcs
+        characters = self._novel.characters
+        locations = self._novel.locations
+        items = self._novel.items
+        for scId in self._modifiedScenes:
+            scene = scenes[scId]
+            arcNodes = self._arcNodes[scId]
+            scene.scnArcs = list_to_string([arc for arc in arcs if arcNodes[arc].state])
+            characterNodes = self._characterNodes[scId]
+            scene.characters = [crId for crId in characters if characterNodes[crId].state]
+            locationNodes = self._locationNodes[scId]
+            scene.locations = [lcId for lcId in locations if locationNodes[lcId].state]
+            itemNodes = self._itemNodes[scId]
+            scene.items = [itId for itId in items if itemNodes[itId].state]
+        self._modifiedScenes.clear()
 
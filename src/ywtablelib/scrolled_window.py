@@ -23,13 +23,31 @@ class ScrolledWindow(ttk.Frame):
         rowTitles -- ttk.Frame for a vertically scrolled column of row titles. 
         columnTitles -- ttk.Frame for a horizontally scrolled row of column titles. 
         display -- ttk.Frame for columns and rows to be displayed and scrolled in both directions.
+        on_mouse_wheel -- mouse wheel event handler, chosen for the platform.
         
     Use the mouse wheel for vertical scrolling, and <Shift>-mouse wheel for horizontal scrolling.    
     """
+    _CONFIGURE_DELAY = 40
+    # int: milliseconds without <Configure> events before the canvases are updated.
+    _SHIFT_MASK = 0x0001
+    # int: bit of the event state that is set while the Shift key is held down.
 
     def __init__(self, parent, *args, **kw):
 
         ttk.Frame.__init__(self, parent, *args, **kw)
+        self._configureJobs = {}
+        # key: <Configure> handler, value: ID of its pending "after" job.
+        self._pendingXScroll = 0
+        self._pendingYScroll = 0
+        # int: scroll units collected from the wheel events since the last update.
+        self._scrollJob = None
+        # ID of the pending "after idle" job that applies the collected scroll units.
+        self._rowTitlesCanvasWidth = None
+        self._columnTitlesCanvasWidth = None
+        self._columnTitlesCanvasHeight = None
+        self._displayCanvasWidth = None
+        # int: canvas sizes last configured to fit the inner frames.
+        # Compared instead of the displayed size, which may differ when packed to fill.
 
         # Scrollbars.
         # Note: For some unknown reason the code for the scrollbars does not work as desired.
@@ -61,16 +79,7 @@ class ScrolledWindow(ttk.Frame):
         self.rowTitles = ttk.Frame(self._rowTitlesCanvas)
         self._rowTitlesCanvas.create_window(0, 0, window=self.rowTitles, anchor=tk.NW, tags="self.rowTitles")
 
-        def _configure_rowTitles(event):
-            # Update the scrollbars to match the size of the display frame.
-            size = (self.rowTitles.winfo_reqwidth(), self.rowTitles.winfo_reqheight())
-            self._rowTitlesCanvas.config(scrollregion="0 0 %s %s" % size)
-
-            # Update the display Canvas's width to fit the inner frame.
-            if self.rowTitles.winfo_reqwidth() != self._rowTitlesCanvas.winfo_width():
-                self._rowTitlesCanvas.config(width=self.rowTitles.winfo_reqwidth())
-
-        self.rowTitles.bind('<Configure>', _configure_rowTitles)
+        self.rowTitles.bind('<Configure>', lambda event: self._debounce(self._configure_row_titles))
 
         # Right column frame.
         rightColFrame = ttk.Frame(self)
@@ -89,18 +98,7 @@ class ScrolledWindow(ttk.Frame):
         self.columnTitles = ttk.Frame(self._columnTitlesCanvas)
         self._columnTitlesCanvas.create_window(0, 0, window=self.columnTitles, anchor=tk.NW, tags="self.columnTitles")
 
-        def _configure_columnTitles(event):
-            # Update the scrollbars to match the size of the display frame.
-            size = (self.columnTitles.winfo_reqwidth(), self.columnTitles.winfo_reqheight())
-            self._columnTitlesCanvas.config(scrollregion="0 0 %s %s" % size)
-
-            # Update the display Canvas's width and height to fit the inner frame.
-            if self.columnTitles.winfo_reqwidth() != self._columnTitlesCanvas.winfo_width():
-                self._columnTitlesCanvas.config(width=self.columnTitles.winfo_reqwidth())
-            if self.columnTitles.winfo_reqheight() != self._columnTitlesCanvas.winfo_height():
-                self._columnTitlesCanvas.config(height=self.columnTitles.winfo_reqheight())
-
-        self.columnTitles.bind('<Configure>', _configure_columnTitles)
+        self.columnTitles.bind('<Configure>', lambda event: self._debounce(self._configure_column_titles))
 
         #--- Vertically and horizontally scrollable display.
         displayFrame = ttk.Frame(rightColFrame)
@@ -116,35 +114,93 @@ class ScrolledWindow(ttk.Frame):
         self.display = ttk.Frame(self._displayCanvas)
         self._displayCanvas.create_window(0, 0, window=self.display, anchor=tk.NW, tags="self.display")
 
-        def _configure_display(event):
-            # Update the scrollbars to match the size of the display frame.
-            size = (self.display.winfo_reqwidth(), self.display.winfo_reqheight())
-            self._displayCanvas.config(scrollregion="0 0 %s %s" % size)
-            if self.display.winfo_reqwidth() != self._displayCanvas.winfo_width():
-                # Update the display Canvas's width to fit the inner frame.
-                self._displayCanvas.config(width=self.display.winfo_reqwidth())
-
-        self.display.bind('<Configure>', _configure_display)
-        if platform.system() == 'Linux':
-            # Vertical scrolling
-            self._rowTitlesCanvas.bind_all("<Button-4>", self.on_mouse_wheel)
-            self._rowTitlesCanvas.bind_all("<Button-5>", self.on_mouse_wheel)
-            self._displayCanvas.bind_all("<Button-4>", self.on_mouse_wheel)
-            self._displayCanvas.bind_all("<Button-5>", self.on_mouse_wheel)
-
-            # Horizontal scrolling
-            self._rowTitlesCanvas.bind_all("<Shift-Button-4>", self.on_mouse_wheel)
-            self._rowTitlesCanvas.bind_all("<Shift-Button-5>", self.on_mouse_wheel)
-            self._displayCanvas.bind_all("<Shift-Button-4>", self.on_mouse_wheel)
-            self._displayCanvas.bind_all("<Shift-Button-5>", self.on_mouse_wheel)
+        self.display.bind('<Configure>', lambda event: self._debounce(self._configure_display))
+        system = platform.system()
+        if system in ('Windows', 'Darwin'):
+            if system == 'Windows':
+                self._wheelDivisor = 120
+            else:
+                self._wheelDivisor = 1
+            # int: wheel event delta per scroll unit.
+            self.on_mouse_wheel = self._on_mouse_wheel_delta
+        else:
+            self.on_mouse_wheel = self._on_mouse_wheel_x11
+        # The handler is chosen once, so the wheel events need not check the platform.
+        # It scrolls horizontally, if the Shift key is held down.
+        # The wheel events go to the node under the mouse pointer, so they are bound
+        # to the "all" tag. One binding per sequence does; the handler scrolls both canvases.
+        # A sequence without modifiers also matches the events with the Shift key held down.
+        if system == 'Linux':
+            self.bind_all("<Button-4>", self.on_mouse_wheel)
+            self.bind_all("<Button-5>", self.on_mouse_wheel)
         else:
-            # Vertical scrolling
-            self._rowTitlesCanvas.bind_all("<MouseWheel>", self.on_mouse_wheel)
-            self._displayCanvas.bind_all("<MouseWheel>", self.on_mouse_wheel)
+            self.bind_all("<MouseWheel>", self.on_mouse_wheel)
 
-            # Horizontal scrolling
-            self._rowTitlesCanvas.bind_all("<Shift-MouseWheel>", self.on_shift_mouse_wheel)
-            self._displayCanvas.bind_all("<Shift-MouseWheel>", self.on_shift_mouse_wheel)
+    def destroy(self):
+        """Cancel the pending <Configure> handlers and scrolling.
+        
+        Extends the superclass method.
+        """
+        for job in self._configureJobs.values():
+            self.after_cancel(job)
+        self._configureJobs = {}
+        if self._scrollJob is not None:
+            self.after_cancel(self._scrollJob)
+            self._scrollJob = None
+        super().destroy()
+
+    def _debounce(self, handler):
+        """Call a <Configure> handler when the events have stopped for a while.
+        
+        Positional arguments:
+            handler -- function to be called with the event argument None.
+            
+        A resize produces a series of <Configure> events. 
+        Instead of updating the canvases for each of them, 
+        restart the handler's timer, so only the final size is processed.
+        """
+        if handler in self._configureJobs:
+            self.after_cancel(self._configureJobs[handler])
+        self._configureJobs[handler] = self.after(self._CONFIGURE_DELAY, self._run_configure_handler, handler)
+
+    def _run_configure_handler(self, handler):
+        del self._configureJobs[handler]
+        handler(None)
+
+    def _configure_row_titles(self, event):
+        # Update the scrollbars to match the size of the display frame.
+        width = self.rowTitles.winfo_reqwidth()
+        height = self.rowTitles.winfo_reqheight()
+        self._rowTitlesCanvas.config(scrollregion=(0, 0, width, height))
+
+        # Update the display Canvas's width to fit the inner frame.
+        if width != self._rowTitlesCanvasWidth:
+            self._rowTitlesCanvas.config(width=width)
+            self._rowTitlesCanvasWidth = width
+
+    def _configure_column_titles(self, event):
+        # Update the scrollbars to match the size of the display frame.
+        width = self.columnTitles.winfo_reqwidth()
+        height = self.columnTitles.winfo_reqheight()
+        self._columnTitlesCanvas.config(scrollregion=(0, 0, width, height))
+
+        # Update the display Canvas's width and height to fit the inner frame.
+        if width != self._columnTitlesCanvasWidth:
+            self._columnTitlesCanvas.config(width=width)
+            self._columnTitlesCanvasWidth = width
+        if height != self._columnTitlesCanvasHeight:
+            self._columnTitlesCanvas.config(height=height)
+            self._columnTitlesCanvasHeight = height
+
+    def _configure_display(self, event):
+        # Update the scrollbars to match the size of the display frame.
+        width = self.display.winfo_reqwidth()
+        height = self.display.winfo_reqheight()
+        self._displayCanvas.config(scrollregion=(0, 0, width, height))
+        if width != self._displayCanvasWidth:
+            # Update the display Canvas's width to fit the inner frame.
+            self._displayCanvas.config(width=width)
+            self._displayCanvasWidth = width
 
     def yview(self, *args):
         self._columnTitlesCanvas.yview(*args)
@@ -154,35 +210,51 @@ class ScrolledWindow(ttk.Frame):
         self._rowTitlesCanvas.xview(*args)
         self._displayCanvas.xview(*args)
 
-    def on_mouse_wheel(self, event):
-        """Vertical scrolling."""
-        if platform.system() == 'Windows':
-            self._rowTitlesCanvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            self._displayCanvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        elif platform.system() == 'Darwin':
-            self._rowTitlesCanvas.yview_scroll(int(-1 * event.delta), "units")
-            self._displayCanvas.yview_scroll(int(-1 * event.delta), "units")
+    def _scroll(self, xUnits, yUnits):
+        """Collect scroll units and apply them when Tk is idle.
+        
+        Positional arguments:
+            xUnits -- int: units to scroll horizontally.
+            yUnits -- int: units to scroll vertically.
+            
+        A fast turn of the mouse wheel produces a series of events. 
+        Their units are added up, so the canvases are scrolled once per idle cycle.
+        """
+        self._pendingXScroll += xUnits
+        self._pendingYScroll += yUnits
+        if self._scrollJob is None:
+            self._scrollJob = self.after_idle(self._apply_scroll)
+
+    def _apply_scroll(self):
+        self._scrollJob = None
+        if self._pendingYScroll:
+            self._rowTitlesCanvas.yview_scroll(self._pendingYScroll, "units")
+            self._displayCanvas.yview_scroll(self._pendingYScroll, "units")
+        if self._pendingXScroll:
+            self._columnTitlesCanvas.xview_scroll(self._pendingXScroll, "units")
+            self._displayCanvas.xview_scroll(self._pendingXScroll, "units")
+        self._pendingXScroll = 0
+        self._pendingYScroll = 0
+
+    def _on_mouse_wheel_delta(self, event):
+        """Scrolling on Windows and macOS."""
+        units = int(-event.delta / self._wheelDivisor)
+        if event.state & self._SHIFT_MASK:
+            self._scroll(units, 0)
+        else:
+            self._scroll(0, units)
+
+    def _on_mouse_wheel_x11(self, event):
+        """Scrolling on X11."""
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
         else:
-            if event.num == 4:
-                self._rowTitlesCanvas.yview_scroll(-1, "units")
-                self._displayCanvas.yview_scroll(-1, "units")
-            elif event.num == 5:
-                self._rowTitlesCanvas.yview_scroll(1, "units")
-                self._displayCanvas.yview_scroll(1, "units")
-
-    def on_shift_mouse_wheel(self, event):
-        """Horizontal scrolling."""
-        if platform.system() == 'Windows':
-            self._columnTitlesCanvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-            self._displayCanvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-        elif platform.system() == 'Darwin':
-            self._columnTitlesCanvas.xview_scroll(int(-1 * event.delta), "units")
-            self._displayCanvas.xview_scroll(int(-1 * event.delta), "units")
+            return
+
+        if event.state & self._SHIFT_MASK:
+            self._scroll(units, 0)
         else:
-            if event.num == 4:
-                self._columnTitlesCanvas.xview_scroll(-1, "units")
-                self._displayCanvas.xview_scroll(-1, "units")
-            elif event.num == 5:
-                self._columnTitlesCanvas.xview_scroll(1, "units")
-                self._displayCanvas.xview_scroll(1, "units")
+            self._scroll(0, units)
 